@@ -5,9 +5,10 @@ import socket
 import sys
 import threading
 from abc import ABC, abstractmethod
+from contextlib import contextmanager
 from time import sleep, time
 from urllib.parse import urljoin
-from typing import Any, Dict
+from typing import Any, Dict, List, Union
 
 import requests
 import serial
@@ -37,6 +38,11 @@ class AbstractConnection(ABC):
         # RS-232 or RS-485 if hardware flow-control is not implemented.
         "command_delay": 0.5,
 
+        # Gap in seconds between the messages sent by transmit_frames().
+        # Only used for the devices that queue incoming commands, so that
+        # they get each command as a separate frame.
+        "frame_gap": 0.002,
+
         # Buffer size for reading incoming data, bytes
         # Typically, serial communiation with devices is reply based rather
         # than stream based. However, not all devices behave themselves,
@@ -81,6 +87,10 @@ class AbstractConnection(ABC):
         self._data_ready.clear()
         # Last reply from the device
         self._last_reply = ""
+        # Lock for consistent update of the last reply and data ready flag
+        self._reply_lock = threading.Lock()
+        # Set while replies to several commands are expected, see accumulating_replies()
+        self._accumulate_replies = threading.Event()
         # Time when last command was sent to the device
         self._last_command_time = time()
 
@@ -88,6 +98,7 @@ class AbstractConnection(ABC):
         self.encoding = self.connection_parameters["encoding"]
         self.receive_buffer_size = self.connection_parameters["receive_buffer_size"]
         self.command_delay = self.connection_parameters["command_delay"]
+        self.frame_gap = self.connection_parameters["frame_gap"]
         self.transmit_timeout = self.connection_parameters["transmit_timeout"]
         self.receive_timeout = self.connection_parameters["receive_timeout"]
 
@@ -119,15 +130,51 @@ class AbstractConnection(ABC):
         """
 
     @abstractmethod
-    def transmit(self, msg: str):
+    def transmit(self, msg: Union[str, bytes]):
         """Transmits the data to the device.
 
         This method has to be redefined in child classes.
 
         Arguments:
-            msg (str): Data to send.
+            msg (str): Data to send. Byte strings are sent as is.
+        """
+
+    def transmit_frames(self, msgs: List[Union[str, bytes]]):
+        """Transmits several messages in a row, frame_gap seconds apart.
+
+        Only the first message waits for command_delay. The following ones
+        are written without clearing the input buffer, so that the replies
+        to the earlier messages aren't lost.
+
+        Arguments:
+            msgs: Data to send. Byte strings are sent as is.
+        """
+
+        self.transmit(msgs[0])
+        for msg in msgs[1:]:
+            sleep(self.frame_gap)
+            self._write_frame(msg)
+
+    def _write_frame(self, msg: Union[str, bytes]):
+        """Writes the data to the device as is, see transmit_frames().
+
+        This method has to be redefined in child classes supporting it.
+        """
+
+        raise NotImplementedError(f"{self.__class__.__name__} doesn't support transmitting several frames!")
+
+    def _encode(self, msg: Union[str, bytes]) -> bytes:
+        """Encodes the message for sending, byte strings are returned as is.
         """
 
+        # Pre-encoded commands are sent as is
+        if isinstance(msg, bytes):
+            return msg
+        try:
+            return msg.encode(self.encoding)
+        except SyntaxError:
+            raise PLConnectionProtocolError("Can't encode command <{}> to a byte-string!".format(msg)) from None
+
     @abstractmethod
     def receive(self):
         """Receives data from the device
@@ -138,6 +185,41 @@ class AbstractConnection(ABC):
             (str): Data from the device.
         """
 
+    @contextmanager
+    def accumulating_replies(self):
+        """Within this context, data arriving before the previous reply has
+        been read out is appended to it instead of replacing it, so that
+        replies to several commands sent back-to-back are not lost.
+        """
+
+        self._accumulate_replies.set()
+        try:
+            yield
+        finally:
+            self._accumulate_replies.clear()
+
+    def _store_reply(self, reply: str):
+        """Puts the data received into receive buffer and raises data ready flag.
+        """
+
+        with self._reply_lock:
+            # If the flag is still set it means receive() hasn't yet read it out
+            if self._data_ready.is_set() is True:
+                if self._accumulate_replies.is_set():
+                    reply = self._last_reply + reply
+                else:
+                    self.logger.warning("Discarding unconsumed device reply <%r>", self._last_reply)
+            self._last_reply = reply
+            self._data_ready.set()
+
+    def _take_reply(self) -> str:
+        """Gets the data from receive buffer and clears the data ready flag.
+        """
+
+        with self._reply_lock:
+            self._data_ready.clear()
+            return self._last_reply
+
     def _clear_data_buffer(self):
         """Debug method to remove accidentally stuck data from the buffer
         between connection closing/re-opening.
@@ -161,6 +243,9 @@ class SerialConnection(AbstractConnection):
         "rtscts": False,
         "dsrdtr": False,
         "inter_byte_timeout": False,
+        # Sets ASYNC_LOW_LATENCY flag on the port (Linux only) to avoid
+        # USB-serial adapters buffering the incoming data for up to 16 ms.
+        "low_latency": False,
     }  # type: ConnectionParameters
 
     def __init__(self, connection_parameters: ConnectionParameters):
@@ -209,6 +294,12 @@ class SerialConnection(AbstractConnection):
             self._connection.open()
         except serial.SerialException as e:
             raise PLConnectionError(f"Can't open serial port {self._connection.port}!") from e
+        if self.connection_parameters.get("low_latency"):
+            try:
+                self._connection.set_low_latency_mode(True)
+            # Not available on this platform or not supported by the port driver
+            except (AttributeError, NotImplementedError, ValueError, OSError) as e:
+                self.logger.warning("Can't enable low latency mode on port %s: %s", self._connection.port, e)
         # Start connection listener
         self.listener = threading.Thread(target=self.connection_listener, name="{}_listener".format(__name__), daemon=True)
         self._connection_close_requested.clear()
@@ -227,25 +318,22 @@ class SerialConnection(AbstractConnection):
                 self.logger.info("Connection listener exiting.")
                 return
             if self._connection.in_waiting > 0:
-                # If the flag is still set it means receive() hasn't yet read it out
-                if self._data_ready.is_set() is True:
-                    self.logger.warning("Discarding unconsumed device reply <%r>", self._last_reply)
-                self._last_reply = ""
-                # Read data from connection into buffer
-                while self._connection.in_waiting > 0 and len(self._last_reply) <= self.receive_buffer_size:
-                    self.logger.debug("connection_listener()::<%s> bytes to read", self._connection.in_waiting)
+                reply_bytes = bytearray()
+                # Read everything available from connection into buffer
+                while self._connection.in_waiting > 0 and len(reply_bytes) <= self.receive_buffer_size:
                     # Lock connection
                     with self._connection_lock:
-                        reply_bytes = self._connection.read(size=self.receive_buffer_size)
-                        self.logger.debug("connection_listener()::got reply <%s>", reply_bytes)
-                    try:
-                        self._last_reply += reply_bytes.decode(self.encoding)
-                    except UnicodeDecodeError:
-                        self.logger.exception("Can't decode device reply!", exc_info=True)
-                        # Unlock connection & break to outer loop discarding current data
-                        break
+                        reply_bytes += self._connection.read(size=self._connection.in_waiting)
+                self.logger.debug("connection_listener()::got reply <%s>", reply_bytes)
+                # Decode once, so that multi-byte characters split between reads are handled
+                try:
+                    reply = reply_bytes.decode(self.encoding)
+                except UnicodeDecodeError:
+                    self.logger.exception("Can't decode device reply!", exc_info=True)
+                    # Discard current data
+                    reply = ""
                 # Notify main thread that it can access _last_reply now
-                self._data_ready.set()
+                self._store_reply(reply)
             # Switch thread context to main
             sleep(self.receiving_interval)
 
@@ -280,17 +368,14 @@ class SerialConnection(AbstractConnection):
             self.logger.warning("Connection listener thread seems to be dead!")
         return is_open
 
-    def transmit(self, msg: str):
+    def transmit(self, msg: Union[str, bytes]):
         """Sends message to the serial port.
         """
 
         # Check if connection is alive
         if not self.is_connection_open():
             raise PLConnectionError("No connection to the device!")
-        try:
-            command = msg.encode(self.encoding)
-        except SyntaxError:
-            raise PLConnectionProtocolError("Can't encode command <{}> to a byte-string!".format(msg)) from None
+        command = self._encode(msg)
         # Calculate if we have to wait after the previous command was sent
         delta = time() - self._last_command_time
         # Subtract 0.5 second for possible jitter/precision errors
@@ -306,6 +391,16 @@ class SerialConnection(AbstractConnection):
         self._last_command_time = time()
         self.logger.debug("transmit()::sent command <%s>", command)
 
+    def _write_frame(self, msg: Union[str, bytes]):
+        """Writes the data to the serial port as is, see transmit_frames().
+        """
+
+        command = self._encode(msg)
+        with self._connection_lock:
+            self._connection.write(command)
+        self._last_command_time = time()
+        self.logger.debug("_write_frame()::sent command <%s>", command)
+
     def receive(self, retries: int = 3):
         """Gets the data from receive buffer, clears the data ready flag
         and passes the data back.
@@ -327,8 +422,7 @@ class SerialConnection(AbstractConnection):
                     raise PLConnectionTimeoutError("No reply received from the device!")
 
         # Unset ready flag
-        self._data_ready.clear()
-        return LabDeviceReply(body=self._last_reply, content_type="chunked")
+        return LabDeviceReply(body=self._take_reply(), content_type="chunked")
 
 
 class TCPIPConnection(AbstractConnection):
@@ -419,22 +513,18 @@ class TCPIPConnection(AbstractConnection):
                     chunk = self._connection.recv(self.receive_buffer_size)
                     # If there's any data, clear buffer
                     if chunk:
-                        # If the flag is still set it means receive()
-                        # hasn't yet read it out
-                        if self._data_ready.is_set() is True:
-                            self.logger.warning("Discarding unconsumed device reply <%r>", self._last_reply)
-                        self._last_reply = ""
+                        reply = ""
                         try:
                             while chunk:
                                 self.logger.debug("connection_listener()::decoding chunk <%s>", chunk)
-                                self._last_reply += chunk.decode(self.encoding)
+                                reply += chunk.decode(self.encoding)
                                 chunk = self._connection.recv(self.receive_buffer_size)
                         # Socket.timeout is raised for blocking sockets after timeout
                         # BlockingIOError is raised for non-blocking sockets
                         # both on Windows and Linux
                         except (socket.timeout, BlockingIOError):
                             # Finished reading data from the socket
-                            self._data_ready.set()
+                            self._store_reply(reply)
                         except UnicodeDecodeError:
                             self.logger.exception("Can't decode packet <%s>!", chunk, exc_info=True)
                 except (socket.timeout, BlockingIOError):
@@ -488,17 +578,14 @@ class TCPIPConnection(AbstractConnection):
             return False
         return True
 
-    def transmit(self, msg: str):
+    def transmit(self, msg: Union[str, bytes]):
         """Sends message to the socket.
         """
 
         # Check if connection is alive
         if not self.is_connection_open():
             raise PLConnectionError("No connection to the device!")
-        try:
-            command = msg.encode(self.encoding)
-        except SyntaxError:
-            raise PLConnectionProtocolError("Can't encode command <{}> to a byte-string!".format(msg)) from None
+        command = self._encode(msg)
         # Calculate if we have to wait after the previous command was sent
         delta = time() - self._last_command_time
         if delta < self.command_delay:
@@ -511,6 +598,16 @@ class TCPIPConnection(AbstractConnection):
         self._last_command_time = time()
         self.logger.debug("transmit()::sent command <%s>", command)
 
+    def _write_frame(self, msg: Union[str, bytes]):
+        """Writes the data to the socket as is, see transmit_frames().
+        """
+
+        command = self._encode(msg)
+        with self._connection_lock:
+            self._connection.send(command)
+        self._last_command_time = time()
+        self.logger.debug("_write_frame()::sent command <%s>", command)
+
     def receive(self, retries: int = 3):
         """Gets the data from receive buffer, clears the data ready flag
         and passes the data back.
@@ -541,8 +638,7 @@ class TCPIPConnection(AbstractConnection):
                     raise PLConnectionTimeoutError("No reply received from the device!")
 
         # Unset data ready flag
-        self._data_ready.clear()
-        return LabDeviceReply(body=self._last_reply, content_type="chunked")
+        return LabDeviceReply(body=self._take_reply(), content_type="chunked")
 
 
 class HTTPConnection(AbstractConnection):
@@ -6,12 +6,12 @@ import threading
 from abc import abstractmethod, ABC
 from functools import wraps
 import queue
-from time import sleep
+from time import monotonic, sleep
 from typing import Optional, Union, Callable, Any, List, Dict, Tuple
 
 from .connections import (HTTPConnection, SerialConnection, TCPIPConnection)
 from .exceptions import (PLConnectionError, PLConnectionTimeoutError, PLDeviceError, PLDeviceCommandError, PLDeviceReplyError)
-from .models import (AbstractLabDevice, ConnectionParameters)
+from .models import (AbstractLabDevice, ConnectionParameters, LabDeviceReply)
 from . import parsers as parser
 
 
@@ -25,53 +25,51 @@ def in_simulation_device_returns(value):
             # Extract object to patch from self argument
             # Self is always passed first
             slf = args[0]
-            nonlocal value
+            # No simulation - return original function straight away
+            if getattr(slf, "simulation", False) is not True:
+                return func(*args, **kwargs)
             # Make a copy so that the original decorator argument won't get
             # mutated between the calls. Important if value is a placeholder
             # (see below)
             dec_retval = copy.copy(value)
-            simulation = getattr(slf, "simulation", False)
-            if simulation is True:
-                # Find the value that we need to return. In most cases that would be
-                # a decorator argument. However, in particularly pesky cases the
-                # wrapped function would expect to read back one of it's arguments.
-                # To implement that, {$args[<number>]} string as decorator argument
-                # is treated specially.
-                try:
-                    if "{$args[" in value:
-                        # Try to find positional argument number for the wrapped
-                        # method call that we want to use as return value by inspecting
-                        # the decorator arguments
-                        argnum = value[value.find("[") + 1:value.find("]")]
-                        try:
-                            argnum = int(argnum)
-                        except ValueError:
-                            slf.logger.error("SIM:: Can't extract argument number from {$args[]}, check syntax!")
-                            dec_retval = None
-                        try:
-                            # Get the actual wrapped method argument from the list
-                            dec_retval = args[argnum]
-                        except IndexError:
-                            slf.logger.error("SIM:: Can't find argument number %s in arguments list <%s>!", value, args)
-                            dec_retval = None
-                except TypeError:
-                    # value is non-iterable
-                    pass
-                # Save reference to original send()
-                orig_send = slf.send
-                # Replace it with lambda returning the value we want - either a
-                # static decorator argument or dynamic value from the wrapped
-                # function call syntax
-                slf.send = lambda *a, **k: dec_retval
-                slf.logger.info("SIM :: Patched send() to return <%s>, calling <%s>", value, func.__name__)
-                # Get return value (if any) for the actual function - other
-                # functions in the call chain may rely on it
-                retval = func(*args, **kwargs)
-                # Restore original send() back
-                slf.send = orig_send
-                return retval
-            # No simulation - return original function
-            return func(*args, **kwargs)
+            # Find the value that we need to return. In most cases that would be
+            # a decorator argument. However, in particularly pesky cases the
+            # wrapped function would expect to read back one of it's arguments.
+            # To implement that, {$args[<number>]} string as decorator argument
+            # is treated specially.
+            try:
+                if "{$args[" in value:
+                    # Try to find positional argument number for the wrapped
+                    # method call that we want to use as return value by inspecting
+                    # the decorator arguments
+                    argnum = value[value.find("[") + 1:value.find("]")]
+                    try:
+                        argnum = int(argnum)
+                    except ValueError:
+                        slf.logger.error("SIM:: Can't extract argument number from {$args[]}, check syntax!")
+                        dec_retval = None
+                    try:
+                        # Get the actual wrapped method argument from the list
+                        dec_retval = args[argnum]
+                    except IndexError:
+                        slf.logger.error("SIM:: Can't find argument number %s in arguments list <%s>!", value, args)
+                        dec_retval = None
+            except TypeError:
+                # value is non-iterable
+                pass
+            # Save reference to original send()
+            orig_send = slf.send
+            # Replace it with lambda returning the value we want - either a
+            # static decorator argument or dynamic value from the wrapped
+            # function call syntax
+            slf.send = lambda *a, **k: dec_retval
+            slf.logger.info("SIM :: Patched send() to return <%s>, calling <%s>", value, func.__name__)
+            # Get return value (if any) for the actual function - other
+            # functions in the call chain may rely on it
+            retval = func(*args, **kwargs)
+            # Restore original send() back
+            slf.send = orig_send
+            return retval
         return wrapper_inner
     return wrapper
 
@@ -112,6 +110,8 @@ class LabDevice(AbstractLabDevice):
         self._lock = threading.RLock()
         # Pool of threads for keepalive/background tasks
         self._background_tasks: List[LabDeviceTask] = []
+        # Recent replies for _cached_send(), command name -> (timestamp, reply)
+        self._reply_cache: Dict[str, Tuple[float, Any]] = {}
 
         # Protocol settings
         self.command_prefix = ""
@@ -195,10 +195,13 @@ class LabDevice(AbstractLabDevice):
             value: Command parameter, if any.
         """
 
-        if value is not None:
-            value = self.check_value(cmd, value)
-
-        message = self.prepare_message(cmd, value)
+        # Commands without parameters may come pre-encoded, see models.preencode_commands()
+        if value is None and "wire" in cmd:
+            message = cmd["wire"]
+        else:
+            if value is not None:
+                value = self.check_value(cmd, value)
+            message = self.prepare_message(cmd, value)
 
         if self._simulation is True:
             self.logger.info("SIM :: Pretending to send message <%r>", message)
@@ -213,6 +216,85 @@ class LabDevice(AbstractLabDevice):
             if reply_expected:
                 return self._recv(cmd)
 
+    def send_pipelined(self, cmds: List[Union[Dict, Tuple[Dict, Any]]]) -> List[Any]:
+        """Sends several commands back-to-back and then reads back the replies,
+        saving a round-trip per command. Each command is written separately,
+        connection frame_gap apart; command_delay only applies before the first one.
+        Only suitable for devices which queue incoming commands and answer
+        them in order, with replies separated by the reply terminator.
+
+        Args:
+            cmds: The commands to send - either bare commands or (command, parameter) tuples.
+
+        Returns:
+            (List): Processed replies, None for the commands not expecting one.
+        """
+
+        pairs = [item if isinstance(item, tuple) else (item, None) for item in cmds]
+        if self._simulation is True or not self.reply_terminator:
+            # Go through send() so that simulation patching applies
+            return [self.send(cmd, value) for cmd, value in pairs]
+
+        messages = []
+        for cmd, value in pairs:
+            if value is None and "wire" in cmd:
+                messages.append(cmd["wire"])
+                continue
+            if value is not None:
+                value = self.check_value(cmd, value)
+            messages.append(self.prepare_message(cmd, value))
+        cmds = [cmd for cmd, _ in pairs]
+        expecting = [cmd for cmd in cmds if cmd.get("reply")]
+
+        # Replies may arrive faster than they are read out, keep them all
+        with self._lock, self.connection.accumulating_replies():
+            self.connection.transmit_frames(messages)
+            self.logger.debug("Sent pipelined messages <%r>", messages)
+            body = ""
+            while body.count(self.reply_terminator) < len(expecting):
+                body += self.connection.receive().body
+        self.logger.debug("Raw pipelined reply from the device: <%r>", body)
+
+        bodies = iter(body.split(self.reply_terminator))
+        replies = []
+        for cmd in cmds:
+            if not cmd.get("reply"):
+                replies.append(None)
+                continue
+            reply = LabDeviceReply(body=next(bodies) + self.reply_terminator)
+            replies.append(self._process_reply(cmd, reply))
+        return replies
+
+    def _cached_send(self, cmd: Dict, ttl: float) -> Any:
+        """Sends a command without parameters, unless the reply to it has been
+        obtained less than ttl seconds ago - then the cached reply is returned.
+
+        Args:
+            cmd: The command to send.
+            ttl: Maximum age of the cached reply, in seconds.
+        """
+
+        cached = self._reply_cache.get(cmd["name"])
+        if cached is not None and monotonic() - cached[0] < ttl:
+            return cached[1]
+        reply = self.send(cmd)
+        self._reply_cache[cmd["name"]] = (monotonic(), reply)
+        return reply
+
+    def _invalidate_cached(self, *cmds: Dict) -> None:
+        """Drops cached replies for the commands provided,
+        or all cached replies if no commands are given.
+
+        Args:
+            cmds: Commands to drop cached replies for.
+        """
+
+        if not cmds:
+            self._reply_cache.clear()
+            return
+        for cmd in cmds:
+            self._reply_cache.pop(cmd["name"], None)
+
     def check_value(self, cmd: Dict, value: Any) -> Any:
         """ Checks the value provided against the definitions in command dict.
         Then does any value conversion/formatting/type casting as needed.
@@ -229,50 +311,41 @@ class LabDevice(AbstractLabDevice):
 
         # Value type casting
         # TODO think about moving type to check dictionary
-        if "type" in cmd.keys() and cmd["type"] is not None:
+        cmd_type = cmd.get("type")
+        if cmd_type is not None:
             try:
-                value = cmd["type"](value)
-                self.logger.debug("check_value()::type casted value <%s> to <%s>.", value, cmd["type"])
+                value = cmd_type(value)
+                self.logger.debug("check_value()::type casted value <%s> to <%s>.", value, cmd_type)
             # Invalid type definition
             except TypeError:
-                self.logger.error("check_value()::Illegal type <%s> specification in command <%s> definition.", cmd["type"], cmd["name"])
+                self.logger.error("check_value()::Illegal type <%s> specification in command <%s> definition.", cmd_type, cmd["name"])
             # Type cast error
             except ValueError:
-                raise PLDeviceCommandError(f"Can't cast value <{value}> to type <{cmd['type']}>.")
-        else:
-            self.logger.debug("check_value()::type casting not required - skipped.")
+                raise PLDeviceCommandError(f"Can't cast value <{value}> to type <{cmd_type}>.")
 
         # Check if any checking/processing is required acc. to cmd definition
-        check_needed = cmd.get("check", False)
-        if check_needed is False:
+        check = cmd.get("check")
+        if not check:
             return value
 
-        # Value checking
-        if "check" in cmd.keys() and cmd["check"] is not None:
-
-            # Min/max check
-            try:
-                if value < cmd["check"]["min"]:
-                    raise PLDeviceCommandError(f"Requested value <{value}> is below limit <{cmd['check']['min']}> !")
-                self.logger.debug("check_value()::min check <%s> < <%s>", value, cmd['check']['min'])
-                if value > cmd["check"]["max"]:
-                    raise PLDeviceCommandError(f"Requested value <{value}> is above limit <{cmd['check']['max']}> !")
-                self.logger.debug("check_value()::max check <%s> > <%s>", value, cmd['check']['max'])
-            # No cmd["check"]["min"] or cmd["check"]["max"]
-            except KeyError:
-                self.logger.debug("check_value()::min/max check not required - skipped.")
-            # Invalid value in cmd["check"]["min"] or cmd["check"]["max"]
-            except TypeError:
-                self.logger.error("Illegal min/max values specification in command <%s> definition!", cmd["name"])
+        # Min/max check
+        try:
+            limit = check.get("min")
+            if limit is not None and value < limit:
+                raise PLDeviceCommandError(f"Requested value <{value}> is below limit <{limit}> !")
+            limit = check.get("max")
+            if limit is not None and value > limit:
+                raise PLDeviceCommandError(f"Requested value <{value}> is above limit <{limit}> !")
+        # Invalid value in check["min"] or check["max"]
+        except TypeError:
+            self.logger.error("Illegal min/max values specification in command <%s> definition!", cmd["name"])
 
-            # Value in range check
+        # Value in range check
+        allowed = check.get("values")
+        if allowed is not None:
             try:
-                if value not in cmd["check"]["values"]:
-                    raise PLDeviceCommandError(f"Requested value <{value}> not in the allowed range <{cmd['check']['values']}>.")
-                self.logger.debug("check_value()::range check <%s> in range <%s>", value, cmd["check"]["values"])
-            # No cmd["check"]["range"]
-            except KeyError:
-                self.logger.debug("check_value()::range check not required - skipped.")
+                if value not in allowed:
+                    raise PLDeviceCommandError(f"Requested value <{value}> not in the allowed range <{allowed}>.")
             except TypeError:
                 self.logger.error("Illegal range specification in command <%s> definition.", cmd["name"])
         return value
@@ -293,9 +366,9 @@ class LabDevice(AbstractLabDevice):
         """
 
         if value is None:
-            return self.command_prefix + cmd["name"] + self.command_terminator
+            return f"{self.command_prefix}{cmd['name']}{self.command_terminator}"
         # Else
-        return self.command_prefix + cmd["name"] + self.args_delimiter + str(value) + self.command_terminator
+        return f"{self.command_prefix}{cmd['name']}{self.args_delimiter}{value}{self.command_terminator}"
 
     def _recv(self, cmd: Dict) -> Union[int, float, str, bool]:
         """Locks the connection object, reads back the reply and re-assembles it
@@ -327,6 +400,15 @@ class LabDevice(AbstractLabDevice):
                 else:
                     self.logger.warning("Received chunked reply, but reply terminator is not set - reassembly not possible!")
         self.logger.debug("Raw reply from the device: <%r>", reply.body)
+        return self._process_reply(cmd, reply)
+
+    def _process_reply(self, cmd: Dict, reply: LabDeviceReply) -> Any:
+        """Parses the complete reply and casts it to the type expected by command definition.
+
+        Args:
+            cmd: Command definition.
+            reply: Reply from the device.
+        """
 
         # Usually, we don't expect empty replies when we are waiting for them
         if reply.body == "":
@@ -519,7 +601,9 @@ class LabDevice(AbstractLabDevice):
 
 
 class LabDeviceTask(threading.Thread):
-    """Simple class to implement periodically running device actions."""
+    """Simple class to implement periodically running device actions.
+    The interval is re-read on every cycle, so it can be adjusted while the task is running.
+    """
 
     def __init__(self, interval: int, method: Callable, args=None):
         """Default constructor"""
@@ -547,7 +631,7 @@ class LabDeviceTask(threading.Thread):
             retval = self.method(*self.args)
             if retval is not None:
                 try:
-                    self.results.put(retval)
+                    self.results.put_nowait(retval)
                 except queue.Full:
                     self.logger.warning("Can't push background task return value <%s> into the queue. The queue is full!", retval)
             self._stop_requested.wait(self.interval)
@@ -1,15 +1,44 @@
 """PyLabware driver for Buchi R300 rotavap."""
 import json
+import threading
 import urllib3
-from typing import Dict, Union, Optional, Any
+from dataclasses import dataclass
+from time import monotonic, sleep
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 # Core imports
 from ..controllers import (
     AbstractRotavap, AbstractPressureController, in_simulation_device_returns)
-from ..exceptions import PLDeviceReplyError, PLDeviceCommandError
+from ..exceptions import PLConnectionError, PLDeviceReplyError, PLDeviceCommandError
 from ..models import ConnectionParameters, LabDeviceCommands, LabDeviceReply
 
 
+def _payload_template(path: List[str]) -> str:
+    """Renders JSON payload for a nested parameter path with a %s
+    placeholder for the JSON-encoded value, e.g. ['heating', 'set']
+    gives '{"heating": {"set": %s}}'.
+    """
+
+    template = "%s"
+    # Build the nested JSON objects bottom up
+    for item in reversed(path):
+        template = "{" + json.dumps(item) + ": " + template + "}"
+    return template
+
+
+def prerender_payloads(cls):
+    """Class decorator for R300 command containers. For every PUT command,
+    stores the rendered JSON payload template under the "payload_template"
+    key, so that prepare_message() only has to encode the value.
+    """
+
+    for cmd in vars(cls).values():
+        if isinstance(cmd, dict) and cmd.get("method") == "PUT":
+            cmd["payload_template"] = _payload_template(cmd["path"])
+    return cls
+
+
+@prerender_payloads
 class R300RotovapCommands(LabDeviceCommands):
     """Collection of command definitions for Buchi R300 rotavap.
     """
@@ -131,6 +160,69 @@ class R300RotovapCommands(LabDeviceCommands):
     SET_PROGRAM_ECO_COOLANTTEMPERATURE = {'name': 'SET_PROGRAM_ECO_COOLANTTEMPERATURE', 'method': 'PUT', 'endpoint': '/api/v1/settings', 'type': float, 'check': {'min': 3, 'max': 50}, 'path': ['program', 'eco', 'coolantTemperature']}
     GET_LEAKTESTS = {'name': 'GET_LEAKTESTS', 'method': 'GET', 'endpoint': '/api/v1/health', 'path': ['leakTests'], 'reply': {'type': list}}
 
+    # ######################### Bulk process access ########################
+    # Gets all process parameters with a single request.
+    GET_PROCESS = {'name': 'GET_PROCESS', 'method': 'GET', 'endpoint': '/api/v1/process', 'path': [], 'reply': {'type': dict}}
+    # Updates several process parameters with a single request.
+    # The value is the nested dictionary to be sent as a payload.
+    SET_PROCESS = {'name': 'SET_PROCESS', 'method': 'PUT', 'endpoint': '/api/v1/process', 'type': dict, 'path': []}
+
+
+@dataclass
+class R300Snapshot:
+    """State of the R300 process parameters at a single point in time,
+    as returned by R300Rotovap.snapshot().
+    """
+
+    __slots__ = ("heating_set", "heating_act", "heating_running",
+                 "cooling_set", "cooling_act", "cooling_running",
+                 "vacuum_set", "vacuum_act", "vapor_temperature",
+                 "rotation_set", "rotation_act", "rotation_running",
+                 "lift_act", "lift_limit", "mode",
+                 "running", "on_hold", "current_error")
+
+    heating_set: float
+    heating_act: float
+    heating_running: bool
+    cooling_set: float
+    cooling_act: float
+    cooling_running: bool
+    vacuum_set: float
+    vacuum_act: float
+    vapor_temperature: float
+    rotation_set: float
+    rotation_act: float
+    rotation_running: bool
+    lift_act: float
+    lift_limit: float
+    mode: str
+    running: bool
+    on_hold: bool
+    current_error: int
+
+
+# Commands the R300Snapshot fields are extracted with
+SNAPSHOT_COMMANDS = {
+    "heating_set": R300RotovapCommands.GET_HEATING_SET,
+    "heating_act": R300RotovapCommands.GET_HEATING_ACT,
+    "heating_running": R300RotovapCommands.GET_HEATING_RUNNING,
+    "cooling_set": R300RotovapCommands.GET_COOLING_SET,
+    "cooling_act": R300RotovapCommands.GET_COOLING_ACT,
+    "cooling_running": R300RotovapCommands.GET_COOLING_RUNNING,
+    "vacuum_set": R300RotovapCommands.GET_VACUUM_SET,
+    "vacuum_act": R300RotovapCommands.GET_VACUUM_ACT,
+    "vapor_temperature": R300RotovapCommands.GET_VACUUM_VAPORTEMP,
+    "rotation_set": R300RotovapCommands.GET_ROTATION_SET,
+    "rotation_act": R300RotovapCommands.GET_ROTATION_ACT,
+    "rotation_running": R300RotovapCommands.GET_ROTATION_RUNNING,
+    "lift_act": R300RotovapCommands.GET_LIFT_ACT,
+    "lift_limit": R300RotovapCommands.GET_LIFT_LIMIT,
+    "mode": R300RotovapCommands.GET_MODE,
+    "running": R300RotovapCommands.GET_GLOBALSTATUS_RUNNING,
+    "on_hold": R300RotovapCommands.GET_GLOBALSTATUS_ONHOLD,
+    "current_error": R300RotovapCommands.GET_GLOBALSTATUS_CURRENTERROR,
+}
+
 
 class R300Rotovap(AbstractRotavap, AbstractPressureController):
     """
@@ -169,6 +261,41 @@ class R300Rotovap(AbstractRotavap, AbstractPressureController):
         # Disable requests warnings about Buchi self-signed certificate
         urllib3.disable_warnings()
 
+        # Limits of the setpoint commands for local validation in _validated_send()
+        self._ranges = {
+            cmd_key: (cmd["check"]["min"], cmd["check"]["max"])
+            for cmd_key, cmd in vars(self.cmd).items()
+            if isinstance(cmd, dict) and cmd.get("check") and "min" in cmd["check"]
+        }
+
+        # Live process values refreshed by the telemetry task, see start_telemetry()
+        self.telemetry_commands = [
+            self.cmd.GET_HEATING_ACT,
+            self.cmd.GET_COOLING_ACT,
+            self.cmd.GET_ROTATION_ACT,
+            self.cmd.GET_VACUUM_ACT,
+            self.cmd.GET_VACUUM_VAPORTEMP,
+            self.cmd.GET_HEATING_RUNNING,
+            self.cmd.GET_COOLING_RUNNING,
+            self.cmd.GET_ROTATION_RUNNING,
+            self.cmd.GET_GLOBALSTATUS_RUNNING,
+        ]
+        # Maximum age of a telemetry value, in seconds, to be returned instead of querying the device
+        self.telemetry_max_age = 1.0
+        self._telemetry: Dict[str, Tuple[float, Any]] = {}
+        self._telemetry_lock = threading.Lock()
+        self._telemetry_task = None
+        # Telemetry requested before that moment predates the last device state change
+        self._telemetry_valid_from = 0.0
+
+        # Lift positions used by lift_up()/lift_down()
+        self._lift_up_pos = self._ranges["SET_LIFT_SET"][0]
+        # Bottom lift limit is only known after querying the device.
+        # It is cached for lift_limit_ttl seconds as it may be changed on the I-300.
+        self._lift_down_pos: Optional[float] = None
+        self._lift_down_pos_timestamp = 0.0
+        self.lift_limit_ttl = 60.0
+
     def prepare_message(self, cmd: Dict, value: Any) -> Any:
         """ Checks parameter value if necessary and prepares JSON payload
         """
@@ -184,16 +311,12 @@ class R300Rotovap(AbstractRotavap, AbstractPressureController):
             if value is not None:
                 self.logger.warning("Trying to send GET request with non-empty payload <%s>", value)
         else:
-            path_to_payload = cmd["path"].copy()
-            parameter = path_to_payload.pop()
-            payload = {parameter: value}
-            # The easiest way to build the rest of the nested dict we need
-            # is to start bottom up
-            path_to_payload.reverse()
-            # Wrap the rest of stuff around
-            for item in path_to_payload:
-                payload = {item: payload}
-            payload = json.dumps(payload)
+            # Templates are pre-rendered for the commands defined in R300RotovapCommands,
+            # see prerender_payloads()
+            template = cmd.get("payload_template")
+            if template is None:
+                template = _payload_template(cmd["path"])
+            payload = template % json.dumps(value)
         message["data"] = payload
         self.logger.debug("prepare_message()::constructed payload <%s>", payload)
         return message
@@ -216,11 +339,111 @@ class R300Rotovap(AbstractRotavap, AbstractPressureController):
         # Run text parsing / type casting, if any
         return super().parse_reply(cmd, reply)
 
+    def _validated_send(self, cmd_key: str, value: Any) -> Any:
+        """Checks the setpoint against the command limits before sending it,
+        so that an invalid value is rejected without any request being made.
+
+        Args:
+            cmd_key (str): Command name in R300RotovapCommands, e.g. "SET_HEATING_SET".
+            value (Any): Setpoint value.
+        """
+
+        cmd = getattr(self.cmd, cmd_key)
+        low, high = self._ranges[cmd_key]
+        try:
+            value = cmd["type"](value)
+        except (TypeError, ValueError):
+            raise PLDeviceCommandError(f"Can't cast value <{value}> to type <{cmd['type']}>.")
+        if not low <= value <= high:
+            raise PLDeviceCommandError(f"Requested value <{value}> is outside the limits [{low}, {high}] for {cmd_key}!")
+        return self.send(cmd, value)
+
+    def _extract_process_value(self, cmd: Dict, process: Dict) -> Any:
+        """Extracts the value for a GET command from the full process state
+        returned by GET_PROCESS.
+        """
+
+        value = process
+        for item in cmd["path"]:
+            value = value[item]
+        return self.cast_reply_type(cmd, value)
+
+    def _update_telemetry(self) -> None:
+        """Fetches the full process state and updates all telemetry values.
+        """
+
+        # Timestamp the data by the request time, see send()
+        timestamp = monotonic()
+        try:
+            process = self.send(self.cmd.GET_PROCESS)
+        except (PLConnectionError, PLDeviceReplyError) as e:
+            self.logger.warning("Telemetry update failed: %s", e)
+            return
+        # Nothing to update in simulation mode
+        if not process:
+            return
+        with self._telemetry_lock:
+            for cmd in self.telemetry_commands:
+                self._telemetry[cmd["name"]] = (timestamp, self._extract_process_value(cmd, process))
+
+    def _telemetry_get(self, cmd: Dict) -> Any:
+        """Returns telemetry value for the command if it is recent enough,
+        otherwise queries the device.
+        """
+
+        with self._telemetry_lock:
+            cached = self._telemetry.get(cmd["name"])
+        if cached is not None and cached[0] >= self._telemetry_valid_from \
+                and monotonic() - cached[0] < self.telemetry_max_age:
+            return cached[1]
+        return self.send(cmd)
+
+    def send(self, cmd, value=None):
+        """Sends the command. Any change of the device settings discards the
+        telemetry values requested before it, so that getters don't return
+        the state from before the change.
+        """
+
+        reply = super().send(cmd, value)
+        if cmd["method"] == "PUT":
+            self._telemetry_valid_from = monotonic()
+        return reply
+
+    def start_telemetry(self, interval: float = 0.5) -> None:
+        """Starts background task refreshing the live process values
+        (temperatures, speed, pressure) with a single request every interval
+        seconds. Getters for these values are then served from the refreshed
+        data, so that multiple consumers don't query the device independently.
+
+        Args:
+            interval (float): Refresh interval in seconds.
+        """
+
+        # The task is also stopped by disconnect(), so check that it is actually alive
+        if self._telemetry_task is not None and self._telemetry_task.is_alive():
+            self.logger.warning("Telemetry task is already running.")
+            return
+        self._telemetry_task = self.start_task(interval=interval, method=self._update_telemetry)
+
+    def stop_telemetry(self) -> None:
+        """Stops background telemetry task.
+        """
+
+        if self._telemetry_task is None:
+            return
+        self.stop_task(self._telemetry_task)
+        self._telemetry_task = None
+        with self._telemetry_lock:
+            self._telemetry.clear()
+
 #   ### General methods ###
 
     def initialize_device(self) -> None:
         """ Initialization sequence
         """
+
+        # Drop cached lift limit in case the device has been reconfigured
+        self._lift_down_pos = None
         # TODO Add any initialization if necessary - e.g. setting default method
 
     def is_connected(self) -> bool:
@@ -280,52 +503,49 @@ class R300Rotovap(AbstractRotavap, AbstractPressureController):
         #   (see github.com/buchi-labortechnik-ag/openinterface_rotavapor/issues/1)
         return self.send(self.cmd.SET_MODE, mode)
 
+    def _mode_guarded_send(self, required_mode: str, cmd: Dict, value: Any = None, switch_mode: bool = True) -> Any:
+        """Sends a command that only applies to a specific program of the R300.
+
+        Args:
+            required_mode (str): Program the command applies to.
+            cmd (Dict): Command to send.
+            value (Any): Command argument, if any.
+            switch_mode (bool): If True, the required program is selected first if necessary.
+                                Otherwise a warning is logged and None is returned
+                                if the required program is not currently selected.
+        """
+
+        current_mode = self.get_mode()
+        if current_mode != required_mode:
+            # Retreiving program parameters without the program being
+            # selected first would trigger a key error when unpacking
+            # the device reply, and setting them would have no effect.
+            if not switch_mode:
+                self.logger.warning("Can't execute %s since the '%s' program is not currently selected "
+                                    "(selected program is '%s'). Select '%s' program first.",
+                                    cmd["name"], required_mode, current_mode, required_mode)
+                return None
+            self.set_mode(required_mode)
+            self.logger.info("Switching program from '%s' to '%s'.", current_mode, required_mode)
+        return self.send(cmd, value)
+
     def set_timer_time(self, time: int) -> None:
         """Sets the time variable for the Timer program.
         """
-        current_mode = self.get_mode()
-        # Defining the time for the Timer program only has an effect
-        # when first the Timer program is selected.
-        if current_mode != 'Timer':
-            self.set_mode('Timer')
-            self.logger.info(f"Switching program from '{current_mode}' to "
-                             "'Timer'.")
 
-        return self.send(self.cmd.SET_TIMER_TIME, time)
+        return self._mode_guarded_send('Timer', self.cmd.SET_TIMER_TIME, time)
 
     def get_timer_set_time(self) -> Optional[int]:
         """Gets the time variable for the Timer program.
         """
-        current_mode = self.get_mode()
-        # Check that 'Timer' program is enabled.
-        # Retreiving the set-point time without
-        # this programm being selected first would trigger
-        # a key error when unpacking the device reply.
-        if current_mode != 'Timer':
-            self.logger.warning("Can't retreive set time of the 'Timer' program "
-                                "since this program is not currently selected "
-                                f"(selected program is '{current_mode}'). Select "
-                                "'Timer' program first.")
-            return None
-        else:
-            return self.send(self.cmd.GET_TIMER_SET_TIME)
+
+        return self._mode_guarded_send('Timer', self.cmd.GET_TIMER_SET_TIME, switch_mode=False)
 
     def get_timer_remaining_time(self) -> Optional[int]:
         """Gets the remaining time of the timer method.
         """
-        current_mode = self.get_mode()
-        # Check that 'Timer' program is enabled.
-        # Retreiving the remaining time without
-        # this programm being selected first would trigger
-        # a key error when unpacking the device reply.
-        if current_mode != 'Timer':
-            self.logger.warning("Can't retreive remaining time of the 'Timer' "
-                                "program since this program is not currently "
-                                f"selected (selected program is '{current_mode}'). "
-                                "Select 'Timer' program first.")
-            return None
-        else:
-            return self.send(self.cmd.GET_TIMER_REMAINING_TIME)
+
+        return self._mode_guarded_send('Timer', self.cmd.GET_TIMER_REMAINING_TIME, switch_mode=False)
 
     def set_solvent_name(self, solvent: str) -> None:
         """Sets the solvent name for the 'Solvent' program.
@@ -338,15 +558,8 @@ class R300Rotovap(AbstractRotavap, AbstractPressureController):
         Exceptions:
             raises PLDeviceCommandError if an unknonw solvent is selected.
         """
-        current_mode = self.get_mode()
-        # Defining the time for the Solvent program only has an effect
-        # when first the Timer program is selected.
-        if current_mode != 'Solvent':
-            self.set_mode('Solvent')
-            self.logger.info(f"Switching program from '{current_mode}' to "
-                             "'Solvent'.")
 
-        self.send(self.cmd.SET_SOLVENT_NAME, solvent)
+        self._mode_guarded_send('Solvent', self.cmd.SET_SOLVENT_NAME, solvent)
 
         # Check whether the rotavap found an entry in it's
         # internal libraries for the desired solvent.
@@ -361,19 +574,8 @@ class R300Rotovap(AbstractRotavap, AbstractPressureController):
     def get_solvent_name(self) -> Optional[str]:
         """Gets the name of the selected solvent for the 'Solvent' program.
         """
-        current_mode = self.get_mode()
-        # Check that 'Solvent' program is enabled.
-        # Retreiving the remaining time without
-        # this programm being selected first would trigger
-        # a key error when unpacking the device reply.
-        if current_mode != 'Solvent':
-            self.logger.warning("Can't retreive selected solvent of the 'Solvent' "
-                                "program since this program is not currently "
-                                f"selected (selected program is '{current_mode}'). "
-                                "Select 'Solvent' program first.")
-            return None
-        else:
-            return self.send(self.cmd.GET_SOLVENT_NAME)
+
+        return self._mode_guarded_send('Solvent', self.cmd.GET_SOLVENT_NAME, switch_mode=False)
 
     def set_method_name(self, method: str) -> None:
         """Sets the method name for the 'Method' program.
@@ -385,15 +587,8 @@ class R300Rotovap(AbstractRotavap, AbstractPressureController):
         Exceptions:
             raises PLDeviceCommandError if an unknonw method is selected.
         """
-        current_mode = self.get_mode()
-        # Defining the time for the Solvent program only has an effect
-        # when first the Timer program is selected.
-        if current_mode != 'Method':
-            self.set_mode('Method')
-            self.logger.info(f"Switching program from '{current_mode}' to "
-                             "'Method'.")
 
-        self.send(self.cmd.SET_METHOD_NAME, method)
+        self._mode_guarded_send('Method', self.cmd.SET_METHOD_NAME, method)
 
         # Check whether the rotavap found an entry in it's
         # internal libraries for the desired solvent.
@@ -407,19 +602,8 @@ class R300Rotovap(AbstractRotavap, AbstractPressureController):
     def get_method_name(self) -> Optional[str]:
         """Gets the name of the selected method for the 'Method' program.
         """
-        current_mode = self.get_mode()
-        # Check that 'Solvent' program is enabled.
-        # Retreiving the remaining time without
-        # this programm being selected first would trigger
-        # a key error when unpacking the device reply.
-        if current_mode != 'Method':
-            self.logger.warning("Can't retreive selected method of the 'Method' "
-                                "program since this program is not currently "
-                                f"selected (selected program is '{current_mode}'). "
-                                "Select 'Method' program first.")
-            return None
-        else:
-            return self.send(self.cmd.GET_METHOD_NAME)
+
+        return self._mode_guarded_send('Method', self.cmd.GET_METHOD_NAME, switch_mode=False)
 
     def set_clouddest_mode(self, mode: str) -> None:
         """Sets the mode name for the 'CloudDest' program.
@@ -428,32 +612,14 @@ class R300Rotovap(AbstractRotavap, AbstractPressureController):
             method (str): Mode name. Valide mode names are
                 'fullControl' and 'endDetection'.
         """
-        current_mode = self.get_mode()
-        # Defining the time for the Solvent program only has an effect
-        # when first the Timer program is selected.
-        if current_mode != 'CloudDest':
-            self.set_mode('CloudDest')
-            self.logger.info(f"Switching program from '{current_mode}' to "
-                             "'CloudDest'.")
 
-        self.send(self.cmd.SET_CLOUDDEST_MODE, mode)
+        self._mode_guarded_send('CloudDest', self.cmd.SET_CLOUDDEST_MODE, mode)
 
     def get_clouddest_mode(self) -> Optional[str]:
         """Gets the current mode of the 'CloudDest' program.
         """
-        current_mode = self.get_mode()
-        # Check that 'CloudDest' program is enabled.
-        # Retreiving the remaining time without
-        # this programm being selected first would trigger
-        # a key error when unpacking the device reply.
-        if current_mode != 'CloudDest':
-            self.logger.warning("Can't retreive selected method of the 'CloudDest' "
-                                "program since this program is not currently "
-                                f"selected (selected program is '{current_mode}'). "
-                                "Select 'CloudDest' program first.")
-            return None
-        else:
-            return self.send(self.cmd.GET_CLOUDDEST_MODE)
+
+        return self._mode_guarded_send('CloudDest', self.cmd.GET_CLOUDDEST_MODE, switch_mode=False)
 
     def set_clouddest_flask_size(self, flask_size: int) -> None:
         """Sets the flask size parameter of the 'CloudDest' program.
@@ -462,32 +628,25 @@ class R300Rotovap(AbstractRotavap, AbstractPressureController):
             flask_size (int): Flask size.
         """
         # TODO: Confirm allowed range of flask sizes against Buchi specs.
-        current_mode = self.get_mode()
-        # Defining the time for the Solvent program only has an effect
-        # when first the Timer program is selected.
-        if current_mode != 'CloudDest':
-            self.set_mode('CloudDest')
-            self.logger.info(f"Switching program from '{current_mode}' to "
-                             "'CloudDest'.")
 
-        self.send(self.cmd.SET_CLOUDDEST_FLASK_SIZE, flask_size)
+        self._mode_guarded_send('CloudDest', self.cmd.SET_CLOUDDEST_FLASK_SIZE, flask_size)
 
     def get_clouddest_flask_size(self) -> Optional[int]:
         """Gets the current flask size parameter of the 'CloudDest' program.
         """
-        current_mode = self.get_mode()
-        # Check that 'CloudDest' program is enabled.
-        # Retreiving the remaining time without
-        # this programm being selected first would trigger
-        # a key error when unpacking the device reply.
-        if current_mode != 'CloudDest':
-            self.logger.warning("Can't retreive selected method of the 'CloudDest' "
-                                "program since this program is not currently "
-                                f"selected (selected program is '{current_mode}'). "
-                                "Select 'CloudDest' program first.")
+
+        return self._mode_guarded_send('CloudDest', self.cmd.GET_CLOUDDEST_FLASK_SIZE, switch_mode=False)
+
+    def snapshot(self) -> Optional[R300Snapshot]:
+        """Gets the state of all main process parameters with a single request.
+        """
+
+        process = self.send(self.cmd.GET_PROCESS)
+        # Nothing to unpack in simulation mode
+        if not process:
             return None
-        else:
-            return self.send(self.cmd.GET_CLOUDDEST_FLASK_SIZE)
+        return R300Snapshot(**{field: self._extract_process_value(cmd, process)
+                               for field, cmd in SNAPSHOT_COMMANDS.items()})
 
     def start(self) -> None:
         """Starts current method
@@ -495,6 +654,23 @@ class R300Rotovap(AbstractRotavap, AbstractPressureController):
 
         self.send(self.cmd.SET_GLOBALSTATUS_RUNNING, True)
 
+    def start_all(self, include_pressure: bool = True) -> None:
+        """Starts bath heating, chiller and rotation with a single request.
+
+        Args:
+            include_pressure (bool): Also start the current method, which
+                                     is the only way to start pressure regulation.
+        """
+
+        payload = {
+            "heating": {"running": True},
+            "cooling": {"running": True},
+            "rotation": {"running": True},
+        }
+        if include_pressure:
+            payload["globalStatus"] = {"running": True}
+        self.send(self.cmd.SET_PROCESS, payload)
+
     def stop(self) -> None:
         """Stops current method
         """
@@ -507,6 +683,42 @@ class R300Rotovap(AbstractRotavap, AbstractPressureController):
         # by pressing STOP on I-300
         self.stop_chiller()
 
+    def wait_for_state(self, kind: str, state: bool = True, timeout: float = 30) -> bool:
+        """Waits until heating, cooling, rotation or the whole process is
+        switched on or off. The device is polled with exponentially increasing
+        interval, from 20 ms up to 0.5 s. If the telemetry task is running,
+        all waiters are served from its values instead.
+
+        Args:
+            kind (str): One of 'heating', 'cooling', 'rotation' or 'process'.
+            state (bool): Running state to wait for.
+            timeout (float): Maximum time to wait, in seconds.
+
+        Returns:
+            (bool): True if the requested state was reached, False on timeout.
+        """
+
+        commands = {
+            "heating": self.cmd.GET_HEATING_RUNNING,
+            "cooling": self.cmd.GET_COOLING_RUNNING,
+            "rotation": self.cmd.GET_ROTATION_RUNNING,
+            "process": self.cmd.GET_GLOBALSTATUS_RUNNING,
+        }
+        try:
+            cmd = commands[kind]
+        except KeyError:
+            raise PLDeviceCommandError(f"Unknown state <{kind}>, valid values are {list(commands)}") from None
+
+        deadline = monotonic() + timeout
+        delay = 0.02
+        while self._telemetry_get(cmd) != state:
+            remaining = deadline - monotonic()
+            if remaining <= 0:
+                return False
+            sleep(min(delay, remaining))
+            delay = min(delay * 1.5, 0.5)
+        return True
+
 #   ### Bath control methods ###
 
     def start_bath(self) -> None:
@@ -537,7 +749,7 @@ class R300Rotovap(AbstractRotavap, AbstractPressureController):
                           Thus, the sensor variable has no effect here.
         """
 
-        self.send(self.cmd.SET_HEATING_SET, temperature)
+        self._validated_send("SET_HEATING_SET", temperature)
 
     def get_temperature(self, sensor: int = 0) -> float:
         """Gets current bath temperature.
@@ -548,7 +760,7 @@ class R300Rotovap(AbstractRotavap, AbstractPressureController):
                           Thus, the sensor variable has no effect here.
         """
 
-        return self.send(self.cmd.GET_HEATING_ACT)
+        return self._telemetry_get(self.cmd.GET_HEATING_ACT)
 
     def get_temperature_setpoint(self, sensor: int = 0) -> float:
         """Reads the current temperature setpoint.
@@ -585,13 +797,13 @@ class R300Rotovap(AbstractRotavap, AbstractPressureController):
         """Sets desired chiller temperature
         """
 
-        self.send(self.cmd.SET_COOLING_SET, temperature)
+        self._validated_send("SET_COOLING_SET", temperature)
 
     def get_chiller_temperature(self) -> float:
         """Gets current chiller temperature.
         """
 
-        return self.send(self.cmd.GET_COOLING_ACT)
+        return self._telemetry_get(self.cmd.GET_COOLING_ACT)
 
     def get_chiller_temperature_setpoint(self) -> float:
         """Gets chiller temperature setpoint.
@@ -623,12 +835,12 @@ class R300Rotovap(AbstractRotavap, AbstractPressureController):
         """Sets rotation speed.
         """
 
-        self.send(self.cmd.SET_ROTATION_SET, speed)
+        self._validated_send("SET_ROTATION_SET", speed)
 
     def get_speed(self):
         """Gets actual rotation speed.
         """
-        return self.send(self.cmd.GET_ROTATION_ACT)
+        return self._telemetry_get(self.cmd.GET_ROTATION_ACT)
 
     def get_speed_setpoint(self):
         """Gets rotation speed setpoint.
@@ -657,21 +869,25 @@ class R300Rotovap(AbstractRotavap, AbstractPressureController):
         """
 
         # Can't reuse set_lift_pos due to bug above
-        self.send(self.cmd.SET_LIFT_SET, self.cmd.SET_LIFT_SET["check"]["min"])
+        self.send(self.cmd.SET_LIFT_SET, self._lift_up_pos)
 
     def lift_down(self):
         """Moves evaporation flask down.
         """
 
         # Can't reuse set_lift_pos due to bug above
-        bottom_limit = self.get_lift_limit()
-        self.send(self.cmd.SET_LIFT_SET, bottom_limit)
+        if self._lift_down_pos is None or monotonic() - self._lift_down_pos_timestamp > self.lift_limit_ttl:
+            self.get_lift_limit()
+        self.send(self.cmd.SET_LIFT_SET, self._lift_down_pos)
 
     def get_lift_limit(self) -> float:
         """Gets lift bottom position limit.
         """
 
-        return self.send(self.cmd.GET_LIFT_LIMIT)
+        limit = self.send(self.cmd.GET_LIFT_LIMIT)
+        self._lift_down_pos = limit
+        self._lift_down_pos_timestamp = monotonic()
+        return limit
 
     def get_lift_set(self) -> float:
         """Returns lift position setpoint
@@ -693,14 +909,14 @@ class R300Rotovap(AbstractRotavap, AbstractPressureController):
         """Sets desired pressure.
         """
 
-        self.send(self.cmd.SET_VACUUM_SET, pressure)
+        self._validated_send("SET_VACUUM_SET", pressure)
 
     @in_simulation_device_returns(1013.25)
     def get_pressure(self) -> float:
         """ Gets current pressure.
         """
 
-        return self.send(self.cmd.GET_VACUUM_ACT)
+        return self._telemetry_get(self.cmd.GET_VACUUM_ACT)
 
     def get_pressure_setpoint(self) -> float:
         """Gets desired pressure setpoint.
@@ -732,7 +948,7 @@ class R300Rotovap(AbstractRotavap, AbstractPressureController):
         """Gets vapour temperature.
         """
 
-        return self.send(self.cmd.GET_VACUUM_VAPORTEMP)
+        return self._telemetry_get(self.cmd.GET_VACUUM_VAPORTEMP)
 
     def get_water_in_temperature(self) -> float:
         """Gets temperature of the water entering condenser.
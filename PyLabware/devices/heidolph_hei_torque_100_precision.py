@@ -10,11 +10,13 @@ import serial
 from .. import parsers as parser
 from ..controllers import AbstractStirringController, in_simulation_device_returns
 from ..exceptions import (PLConnectionError,
+                          PLDeviceCommandError,
                           PLDeviceInternalError,
                           PLDeviceReplyError)
-from ..models import LabDeviceCommands, ConnectionParameters
+from ..models import LabDeviceCommands, ConnectionParameters, preencode_commands
 
 
+@preencode_commands(terminator="\r\n")
 class HeiTorque100PrecisionStirrerCommands(LabDeviceCommands):
     """Collection of command definitions for HeiTorque 100 Control overhead stirrer.
     """
@@ -26,6 +28,17 @@ class HeiTorque100PrecisionStirrerCommands(LabDeviceCommands):
     OVERLOAD_ERROR = "Overload!"
     MANUAL_STOP_ERROR = "Stopped Manually!"
 
+    # Error messages for the status replies reported as errors
+    ERROR_TABLE = {
+        OVERHEAT_ERROR: "Device overheat error!",
+        MOTOR_ERROR: "Device motor error!",
+        OVERLOAD_ERROR: "Device overload error!",
+        MANUAL_STOP_ERROR: "Device manual stop error!",
+    }
+
+    # Maximum difference between requested and read back speed setpoint, RPM
+    SPEED_TOLERANCE = 1
+
     # Default name for the HT 100 Precision model replied to T command
     DEFAULT_NAME = "HT:100P"
 
@@ -33,23 +46,23 @@ class HeiTorque100PrecisionStirrerCommands(LabDeviceCommands):
     # Clear OVERLOAD error
     CLEAR_ERROR = {"name": "C", "reply": {"type": str}}
     # Get status/error message
-    GET_STATUS = {"name": "f", "reply": {"type": str, "parser": parser.researcher, "args": [r'FLT:\s(.*!)']}}
+    GET_STATUS = {"name": "f", "reply": {"type": str, "parser": parser.researcher, "args": [re.compile(r'FLT:\s(.*!)')]}}
     # Identify the instrument (Flash the device display)
     IDENTIFY = {"name": "M", "reply": {"type": str}}
     # Get stirrer name
     GET_NAME = {"name": "T", "reply": {"type": str}}
     # Stop stirrer
-    STOP = {"name": "R0000", "reply": {"type": int, "parser": parser.researcher, "args": [r'SET:\s(\d{1,4})']}}
+    STOP = {"name": "R0000", "reply": {"type": int, "parser": parser.partitioner, "args": ["SET"]}}
     # Set rotation speed (rpm)
     SET_SPEED = {"name": "R", "type": int, "check": {"min": 10, "max": 2000},
-                 "reply": {"type": int, "parser": parser.researcher, "args": [r'SET:\s(\d{1,4})']}}
+                 "reply": {"type": int, "parser": parser.partitioner, "args": ["SET"]}}
     # Get rotation speed setpoint
-    GET_SPEED_SET = {"name": "s", "reply": {"type": int, "parser": parser.researcher, "args": [r'SET:\s(\d{1,4})']}}
+    GET_SPEED_SET = {"name": "s", "reply": {"type": int, "parser": parser.partitioner, "args": ["SET"]}}
     # Get actual rotation speed
-    GET_SPEED = {"name": "r", "reply": {"type": int, "parser": parser.researcher, "args": [r'RPM:\s(\d{1,4})']}}
+    GET_SPEED = {"name": "r", "reply": {"type": int, "parser": parser.partitioner, "args": ["RPM"]}}
 
     # Get torque (in Newton millimeter - Nmm)
-    GET_TORQUE = {"name": "m", "reply": {"type": int, "parser": parser.researcher, "args": [r'NCM:\s(-*?\d{1,4})']}}
+    GET_TORQUE = {"name": "m", "reply": {"type": int, "parser": parser.partitioner, "args": ["NCM"]}}
     # Switch remote control off; motor speed is controlled by knob position.
     # WARNING! If this command is issued while the stirrer is rotating, it reads
     # out actual knob position & applies according speed, it wouldn't stop!
@@ -85,6 +98,7 @@ class HeiTorque100PrecisionStirrer(AbstractStirringController):
         connection_parameters["baudrate"] = 9600
         connection_parameters["bytesize"] = serial.EIGHTBITS
         connection_parameters["parity"] = serial.PARITY_NONE
+        connection_parameters["low_latency"] = True
 
         super().__init__(device_name, connection_mode, connection_parameters)
 
@@ -97,6 +111,11 @@ class HeiTorque100PrecisionStirrer(AbstractStirringController):
         # This stirrer lack explicit start/stop commands, so it starts as soon as you set non-zero speed
         self._speed_setpoint = 0
         self._running = False
+        # Status replies younger than that (in seconds) are reused by get_status()
+        self._status_ttl = 0.1
+        # Speed limits for checking the setpoint while the stirrer is not running
+        self._speed_min = self.cmd.SET_SPEED["check"]["min"]
+        self._speed_max = self.cmd.SET_SPEED["check"]["max"]
 
     def parse_reply(self, cmd: Dict, reply: Any) -> Any:
         """Overloaded base class method to handle regex parsing.
@@ -113,12 +132,8 @@ class HeiTorque100PrecisionStirrer(AbstractStirringController):
         reply = super().parse_reply(cmd, reply)
         # If we parsed with regexp, extract first matched group from Regex match object
         if isinstance(reply, re.Match):  # type: ignore
-            if reply is None:
-                raise PLDeviceReplyError("Regular expression match failed on device reply!")
-            reply = reply[1]
-            self.logger.debug("parse_reply()::extracted regex result <%s>", reply)
             # Cast the right type
-            return self.cast_reply_type(cmd, reply)
+            return self.cast_reply_type(cmd, reply[1])
         return reply
 
     def initialize_device(self):
@@ -144,28 +159,15 @@ class HeiTorque100PrecisionStirrer(AbstractStirringController):
         """ Gets device status.
         """
 
-        return self.send(self.cmd.GET_STATUS)
+        return self._cached_send(self.cmd.GET_STATUS, self._status_ttl)
 
     def check_errors(self):
         """Check device for errors & raises PLDeviceInternalError with
         appropriate error message.
         """
 
-        status = self.get_status()
-        if status == self.cmd.OVERHEAT_ERROR:
-            errmsg = "Device overheat error!"
-            self.logger.error(errmsg)
-            raise PLDeviceInternalError(errmsg)
-        if status == self.cmd.MOTOR_ERROR:
-            errmsg = "Device motor error!"
-            self.logger.error(errmsg)
-            raise PLDeviceInternalError(errmsg)
-        if status == self.cmd.OVERLOAD_ERROR:
-            errmsg = "Device overload error!"
-            self.logger.error(errmsg)
-            raise PLDeviceInternalError(errmsg)
-        if status == self.cmd.MANUAL_STOP_ERROR:
-            errmsg = "Device manual stop error!"
+        errmsg = self.cmd.ERROR_TABLE.get(self.get_status())
+        if errmsg is not None:
             self.logger.error(errmsg)
             raise PLDeviceInternalError(errmsg)
 
@@ -174,6 +176,7 @@ class HeiTorque100PrecisionStirrer(AbstractStirringController):
         """
 
         self.send(self.cmd.CLEAR_ERROR)
+        self._invalidate_cached(self.cmd.GET_STATUS)
 
     @in_simulation_device_returns(HeiTorque100PrecisionStirrerCommands.DEFAULT_NAME)
     def is_connected(self) -> bool:
@@ -193,9 +196,11 @@ class HeiTorque100PrecisionStirrer(AbstractStirringController):
         """Checks whether device is idle.
         """
 
-        if not self.is_connected():
+        # A valid status reply is a proof of connection as well
+        try:
+            ready = self.get_status()
+        except PLConnectionError:
             return False
-        ready = self.get_status()
         return ready == self.cmd.NO_ERROR and not self._running
 
     def start_stirring(self):
@@ -214,6 +219,7 @@ class HeiTorque100PrecisionStirrer(AbstractStirringController):
         """
 
         readback_setpoint = self.send(self.cmd.STOP)
+        self._invalidate_cached(self.cmd.GET_STATUS)
         if readback_setpoint != 0:
             raise PLDeviceReplyError(f"Error stopping stirrer. Requested setpoint <{self._speed_setpoint}> RPM, "
                                      f"read back setpoint <{readback_setpoint}> RPM")
@@ -224,19 +230,38 @@ class HeiTorque100PrecisionStirrer(AbstractStirringController):
         """Sets rotation speed in rpm.
         """
 
+        speed_type = self.cmd.SET_SPEED["type"]
+        try:
+            speed = speed_type(speed)
+        except (TypeError, ValueError):
+            raise PLDeviceCommandError(f"Can't cast value <{speed}> to type <{speed_type}>.") from None
         # If the stirrer is not running, just update internal variable
         if not self._running:
             # Check value against limits before updating
-            self.check_value(self.cmd.SET_SPEED, speed)
+            if not self._speed_min <= speed <= self._speed_max:
+                raise PLDeviceCommandError(f"Requested speed <{speed}> is outside the limits "
+                                           f"[{self._speed_min}, {self._speed_max}] RPM!")
             self._speed_setpoint = speed
         else:
             readback_setpoint = self.send(self.cmd.SET_SPEED, speed)
-            if readback_setpoint != speed:
-                self.stop()
-                raise PLDeviceReplyError(f"Error setting stirrer speed. Requested setpoint <{self._speed_setpoint}> "
-                                         f"RPM, read back setpoint <{readback_setpoint}> RPM")
+            self._invalidate_cached(self.cmd.GET_STATUS)
+            if not self._speed_matches(readback_setpoint, speed):
+                # The device occasionally garbles replies, so read the setpoint back once more before giving up
+                self.logger.warning("Read back speed setpoint <%s> RPM doesn't match requested <%s> RPM, re-reading.",
+                                    readback_setpoint, speed)
+                readback_setpoint = self.send(self.cmd.GET_SPEED_SET)
+                if not self._speed_matches(readback_setpoint, speed):
+                    self.stop()
+                    raise PLDeviceReplyError(f"Error setting stirrer speed. Requested setpoint <{speed}> RPM, "
+                                             f"read back setpoint <{readback_setpoint}> RPM")
             self._speed_setpoint = speed
 
+    def _speed_matches(self, readback_setpoint: Optional[int], speed: int) -> bool:
+        """Checks whether the speed setpoint read back matches the requested one.
+        """
+
+        return readback_setpoint is not None and abs(readback_setpoint - speed) <= self.cmd.SPEED_TOLERANCE
+
     def get_speed(self) -> int:
         """Gets actual rotation speed in rpm.
         """
@@ -1,5 +1,6 @@
 """PyLabware driver for Huber Petite Fleur chiller."""
 
+from functools import lru_cache
 from time import sleep
 from typing import Tuple, Optional, Union
 import serial
@@ -11,9 +12,10 @@ from PyLabware.controllers import (
 from PyLabware.exceptions import (PLConnectionError,
                                       PLDeviceCommandError,
                                       PLDeviceReplyError)
-from PyLabware.models import LabDeviceCommands, ConnectionParameters
+from PyLabware.models import LabDeviceCommands, ConnectionParameters, preencode_commands
 
 
+@preencode_commands(terminator="\r\n")
 class PetiteFleurChillerCommands(LabDeviceCommands):
     """Collection of command definitions for Huber PetiteFleur chiller."""
 
@@ -41,6 +43,15 @@ class PetiteFleurChillerCommands(LabDeviceCommands):
         "Freeze protection: "
     ]
 
+    # Human-readable values of each status bit, indexed by the bit value
+    _ACTIVE = ("INACTIVE", "ACTIVE")
+    _YES_NO = ("NO", "YES")
+    STATUS_VALUES = (_ACTIVE, _ACTIVE, _ACTIVE, _ACTIVE, _ACTIVE, _YES_NO, _ACTIVE,
+                     ("Expert Mode", "Automatic Mode"), _YES_NO, _YES_NO, _ACTIVE, _ACTIVE, _ACTIVE,
+                     ("System restarted", "No Failure"), _ACTIVE)
+    # (bit shift, label, values) for each status bit, most significant bit first
+    STATUS_DECODERS = tuple(zip(range(len(STATUSES) - 1, -1, -1), STATUSES, STATUS_VALUES))
+
     # Control Commands
     # The string is actually an hex from -15111 to 50000 (in cent of °C)
     SET_TEMP_SP = {"name": "{M00", "type": str, "reply": {"type": str, "parser": parser.slicer, "args": [4, 8]}}
@@ -72,6 +83,14 @@ class PetiteFleurChillerCommands(LabDeviceCommands):
     # Extras
     KEY_LOCK = {"name": "{M17", "type": str, "reply": {"type": str}}  # Locks the manual interface in the system with 1
 
+    # Time to keep the line quiet after the command, seconds.
+    # During the start of the machine no other command should be allowed,
+    # otherwise silent crash of the system without answer occurs.
+    SETTLE_TIME = {
+        START_TEMP_CONTROL["name"]: 10,
+        START_CIRCULATOR["name"]: 5,
+    }
+
 
 class PetiteFleurChiller(AbstractTemperatureController):
     """
@@ -93,7 +112,10 @@ class PetiteFleurChiller(AbstractTemperatureController):
         connection_parameters["baudrate"] = 9600
         connection_parameters["bytesize"] = serial.EIGHTBITS
         connection_parameters["parity"] = serial.PARITY_NONE
-        connection_parameters["command_delay"] = 1.0
+        # Every command is acknowledged by a reply, so only a short gap is needed
+        # Commands requiring longer quiescence are listed in SETTLE_TIME
+        connection_parameters["command_delay"] = 0.2
+        connection_parameters["low_latency"] = True
 
         super().__init__(device_name, connection_mode, connection_parameters)
         # Protocol settings
@@ -101,10 +123,41 @@ class PetiteFleurChiller(AbstractTemperatureController):
         self.reply_terminator = "\r\n"
         self.args_delimiter = ""
 
+        # Replies younger than that (in seconds) are reused by the getters
+        # The chiller state changes slowly compared to the polling rate
+        self._reply_ttl = 0.5
+
     def initialize_device(self):
         """ This chiller doesn't need/have any initialization.
         """
 
+    def send(self, cmd, value=None):
+        """Sends the command and, for the commands listed in SETTLE_TIME,
+        keeps the connection locked until the chiller is ready for the next one.
+        """
+
+        settle = self.cmd.SETTLE_TIME.get(cmd["name"])
+        # Simulated device has nothing to wait for
+        if settle is None or self._simulation is True:
+            return super().send(cmd, value)
+        with self._lock:
+            reply = super().send(cmd, value)
+            self.logger.debug("Waiting %s s for the device to settle after <%s>", settle, cmd["name"])
+            sleep(settle)
+        return reply
+
+    def send_pipelined(self, cmds):
+        """Refuses the commands listed in SETTLE_TIME, as pipelining would
+        skip the quiet period after them - those have to go through send().
+        """
+
+        for item in cmds:
+            cmd = item[0] if isinstance(item, tuple) else item
+            if cmd["name"] in self.cmd.SETTLE_TIME:
+                raise PLDeviceCommandError(f"Command <{cmd['name']}> needs the device to settle "
+                                           "and can't be pipelined, use send() instead!")
+        return super().send_pipelined(cmds)
+
     def is_connected(self) -> bool:
         """Tries to get chiller status & compares it to the template value.
         """
@@ -120,9 +173,11 @@ class PetiteFleurChiller(AbstractTemperatureController):
         #TODO Probably rather has to be done by checking device status.
         """
 
-        if not self.is_connected():
+        # Lost connection shows up as an exception, no need for a separate check
+        try:
+            p = self.get_pump_pressure()
+        except PLConnectionError:
             return False
-        p = self.get_pump_pressure()
         return p < 5
 
     def get_errors(self):
@@ -148,10 +203,15 @@ class PetiteFleurChiller(AbstractTemperatureController):
         16 bit signed integer.
         """
 
-        res = temp & 0b0111111111111111
-        if res == temp:
-            return float(res) / 100
-        return float(res - 0X8000) / 100
+        # Sign-extend from bit 15
+        return ((temp ^ 0x8000) - 0x8000) / 100
+
+    @staticmethod
+    def hex_transform(value: int) -> str:
+        """Returns the value as 4-digit hex string of the 16 bit two's complement.
+        """
+
+        return "{:04X}".format(value & 0xFFFF)
 
     def start_temperature_regulation(self):
         """Starts the chiller.
@@ -159,12 +219,9 @@ class PetiteFleurChiller(AbstractTemperatureController):
 
         # start circulation
         t = self.send(self.cmd.START_TEMP_CONTROL)
-        # The 10 + 5 s delay is needed because during the start of the machine no other command
-        # should be allowed, otherwise silent crash of the system without answer occurs
-        sleep(10)
         # start temperature control
         p = self.send(self.cmd.START_CIRCULATOR)
-        sleep(5)
+        self._invalidate_cached()
         return bool(int(p and t))
 
     @in_simulation_device_returns('0')
@@ -172,10 +229,9 @@ class PetiteFleurChiller(AbstractTemperatureController):
         """Stops the chiller.
         """
 
-        # stop temperature control
-        p = self.send(self.cmd.STOP_CIRCULATOR)
-        # stop circulation
-        t = self.send(self.cmd.STOP_TEMP_CONTROL)
+        # stop temperature control, then circulation
+        p, t = self.send_pipelined([self.cmd.STOP_CIRCULATOR, self.cmd.STOP_TEMP_CONTROL])
+        self._invalidate_cached()
         return int(p and t) == 0
 
     @in_simulation_device_returns("{$args[1]}")
@@ -191,9 +247,9 @@ class PetiteFleurChiller(AbstractTemperatureController):
 
         # setting the setpoint
         if -151 <= temperature <= 327:
-            temperature = int(temperature * 100)
-            temperature = temperature & 0xFFFF
-            readback_temp = self.send(self.cmd.SET_TEMP_SP, "{:04X}".format(temperature))
+            temperature = round(temperature * 100)
+            readback_temp = self.send(self.cmd.SET_TEMP_SP, self.hex_transform(temperature))
+            self._invalidate_cached(self.cmd.GET_TEMP_SP)
             if readback_temp is None:
                 raise PLDeviceReplyError(f"Error setting temperature. Requested setpoint <{temperature}>, read back setpoint <{readback_temp}>")
         else:
@@ -208,7 +264,7 @@ class PetiteFleurChiller(AbstractTemperatureController):
                           Thus, the sensor variable has no effect here.
         """
 
-        answer = self.send(self.cmd.GET_TEMP_BATH)
+        answer = self._cached_send(self.cmd.GET_TEMP_BATH, self._reply_ttl)
         return self.temp_transform(int(answer, base=16))
 
     def get_temperature_setpoint(self, sensor: int = 0) -> float:
@@ -220,7 +276,7 @@ class PetiteFleurChiller(AbstractTemperatureController):
                           Thus, the sensor variable has no effect here.
         """
 
-        answer = self.send(self.cmd.GET_TEMP_SP)
+        answer = self._cached_send(self.cmd.GET_TEMP_SP, self._reply_ttl)
         return self.temp_transform(int(answer, base=16))
 
     # It seems it doesn't work although the manual says it should
@@ -231,28 +287,23 @@ class PetiteFleurChiller(AbstractTemperatureController):
         ramp. Maximum ramp is a tad over 9 hours.
         """
 
-        # setting the setpoint
-        if -32767 <= time <= 32767:
-            ramp_duration_hex = "{:04X}".format(time & 0xFFFF)  # convert to two's complement hex string
-            reply = self.send(self.cmd.SET_RAMP_DURATION, ramp_duration_hex)
-            if (reply is not None) and (-151 <= end_temperature <= 327):
-                end_temperature = int(end_temperature * 100)  # convert to appropriate decimal format
-                end_temperature_hex = "{:04X}".format(end_temperature & 0xFFFF)  # convert to two's complement hex string
-                self.send(self.cmd.START_RAMP, end_temperature_hex)
-            else:
-                raise PLDeviceCommandError('The requested setpoint is out of range!')
-        else:
+        if not -32767 <= time <= 32767:
             raise PLDeviceCommandError('The requested duration is out of range!')
+        if not -151 <= end_temperature <= 327:
+            raise PLDeviceCommandError('The requested setpoint is out of range!')
+        ramp_duration_hex = self.hex_transform(time)
+        end_temperature_hex = self.hex_transform(round(end_temperature * 100))  # convert to appropriate decimal format
+        # Both values are checked upfront, so duration and setpoint can go in one exchange
+        self.send_pipelined([(self.cmd.SET_RAMP_DURATION, ramp_duration_hex),
+                             (self.cmd.START_RAMP, end_temperature_hex)])
+        self._invalidate_cached()
 
     def get_ramp_details(self) -> Tuple[int, float]:
         """Get remaining time and target temperature for the ramp.
         """
 
-        rem_time = self.send(self.cmd.GET_RAMP_TIME)
-        rem_time = int(rem_time, base=16)
-        targ_temp = self.send(self.cmd.GET_RAMP_TEMP)
-        targ_temp = int(targ_temp, base=16)
-        return rem_time, self.temp_transform(targ_temp)
+        rem_time, targ_temp = self.send_pipelined([self.cmd.GET_RAMP_TIME, self.cmd.GET_RAMP_TEMP])
+        return int(rem_time, base=16), self.temp_transform(int(targ_temp, base=16))
 
     def start_temp_ctrl(self, program: str) -> int:
         """Starts the temperature control program input from 0001 -> 0010
@@ -266,40 +317,39 @@ class PetiteFleurChiller(AbstractTemperatureController):
         """Returns the status of the chiller.
         """
 
-        s = self.send(self.cmd.GET_STATUS)
+        s = self._cached_send(self.cmd.GET_STATUS, self._reply_ttl)
         return '{:015b}'.format(int(s, 16) & 0b111111111111111)
 
-    def interpret_status(self, status_string: str) -> str:
-        """Interprets the status string to return human-readable status
+    def interpret_status(self, status: Union[int, str]) -> str:
+        """Interprets the status to return human-readable status.
+
+        Args:
+            status: Status as returned by get_status() or as an integer.
+        """
+
+        if isinstance(status, str):
+            status = int(status, 2)
+        return self._decode_status(status)
+
+    @staticmethod
+    @lru_cache(maxsize=128)
+    def _decode_status(status: int) -> str:
+        """Builds human-readable status from the status bits.
+        The chiller goes through a handful of states only, so results are memoized.
         """
 
-        ret = ""
-        ans = {'0': 'INACTIVE', '1': 'ACTIVE'}
-        p7 = {'0': 'Expert Mode', '1': 'Automatic Mode'}
-        p13 = {'1': 'No Failure', '0': 'System restarted'}
-        p5_8_9 = {'0': 'NO', '1': 'YES'}
-        count = 0
-        for i in status_string:
-            if count == 7:
-                ret += self.cmd.STATUSES[count] + p7[i] + "\n"
-            elif count in (5, 8, 9):
-                ret += self.cmd.STATUSES[count] + p5_8_9[i] + "\n"
-            elif count == 13:
-                ret += self.cmd.STATUSES[count] + p13[i] + "\n"
-            else:
-                ret += self.cmd.STATUSES[count] + ans[i] + "\n"
-            count += 1
-        return ret
+        decoders = PetiteFleurChillerCommands.STATUS_DECODERS
+        return "".join(f"{label}{values[(status >> shift) & 1]}\n" for shift, label, values in decoders)
 
     def get_pump_pressure(self) -> int:
         """Returns the pump pressure (can be used as measure of the pump activity).
         """
 
-        reply = self.send(self.cmd.GET_PUMP_PRESSURE)
+        reply = self._cached_send(self.cmd.GET_PUMP_PRESSURE, self._reply_ttl)
         return int(reply, base=16) - 1000
 
     def set_circulator_control(self, pump_mode: int):
         """Sets the compressor control mode.
         """
 
-        self.send(self.cmd.SET_PUMP_MODE, "{:04X}".format(pump_mode & 0XFFFF))
+        self.send(self.cmd.SET_PUMP_MODE, self.hex_transform(pump_mode))
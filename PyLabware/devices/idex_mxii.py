@@ -1,6 +1,7 @@
 """PyLabware driver for IDEX MX II series six-port sample injection valve."""
 
 from typing import Optional, Union
+import threading
 import time
 import serial
 
@@ -10,9 +11,10 @@ from ..exceptions import (PLConnectionError,
                           PLDeviceCommandError,
                           PLDeviceInternalError,
                           PLConnectionTimeoutError)
-from ..models import LabDeviceCommands, ConnectionParameters
+from ..models import LabDeviceCommands, ConnectionParameters, preencode_commands
 
 
+@preencode_commands(terminator="\r")
 class IDEXMXIIValveCommands(LabDeviceCommands):
     """Collection of command definitions for for IDEX valve controller USB protocol.
     """
@@ -29,6 +31,11 @@ class IDEXMXIIValveCommands(LabDeviceCommands):
     }
     # Separate literal for busy status, for ease of manipulation
     STATUS_BUSY = "*"
+    # Status codes reported as errors
+    STATUS_ERROR_CODES = frozenset(STATUS_CODES) - {STATUS_BUSY}
+
+    # Zero-padded position arguments for MOVE_TO_POSITION
+    POSITION_STRINGS = tuple(f"{i:02d}" for i in range(100))
 
     # Command modes for external input
     COMMAND_MODES = {
@@ -94,6 +101,7 @@ class IDEXMXIIValve(AbstractDistributionValve):
         connection_parameters["baudrate"] = 19200
         connection_parameters["bytesize"] = serial.EIGHTBITS
         connection_parameters["parity"] = serial.PARITY_NONE
+        connection_parameters["low_latency"] = True
 
         super().__init__(device_name, connection_mode, connection_parameters)
 
@@ -102,6 +110,13 @@ class IDEXMXIIValve(AbstractDistributionValve):
         self.reply_terminator = "\r"
         self.args_delimiter = ""
 
+        # Status replies younger than that (in seconds) are reused by get_status()
+        self._status_ttl = 0.1
+        # Whether the device has answered a firmware revision request
+        self._connection_verified = False
+        # Timer switching the valve back after non-blocking sample()
+        self._sample_timer: Optional[threading.Timer] = None
+
     def initialize_device(self):
         """Not supported on this device.
         """
@@ -118,6 +133,7 @@ class IDEXMXIIValve(AbstractDistributionValve):
                 return False
         except PLConnectionError:
             return False
+        self._connection_verified = True
         return True
 
     def is_idle(self):
@@ -126,9 +142,17 @@ class IDEXMXIIValve(AbstractDistributionValve):
         return self.get_status() != self.cmd.STATUS_BUSY
 
     def get_status(self):
-        """Returns device status.
+        """Returns device status. On the first call the firmware revision
+        is requested in the same exchange to confirm the connection.
         """
-        return self.send(self.cmd.GET_STATUS)
+
+        if self._connection_verified or self._simulation is True:
+            return self._cached_send(self.cmd.GET_STATUS, self._status_ttl)
+        fw_rev, status = self.send_pipelined([self.cmd.GET_FW_REV, self.cmd.GET_STATUS])
+        if not fw_rev:
+            raise PLConnectionError("Device didn't report firmware revision!")
+        self._connection_verified = True
+        return status
 
     def check_errors(self):
         """Check device for errors & raises PLDeviceInternalError with
@@ -136,7 +160,7 @@ class IDEXMXIIValve(AbstractDistributionValve):
         """
 
         status = self.get_status()
-        if status in self.cmd.STATUS_CODES and status != self.cmd.STATUS_BUSY:
+        if status in self.cmd.STATUS_ERROR_CODES:
             errmsg = self.cmd.STATUS_CODES[status]
             self.logger.error(errmsg)
             raise PLDeviceInternalError(errmsg)
@@ -158,6 +182,7 @@ class IDEXMXIIValve(AbstractDistributionValve):
         """
 
         self.send(self.cmd.MOVE_HOME)
+        self._invalidate_cached(self.cmd.GET_STATUS)
 
     def set_valve_position(self, position: int):
         """Move value to specified position.
@@ -170,8 +195,11 @@ class IDEXMXIIValve(AbstractDistributionValve):
         # This device replies \r if all OK, or nothing if the command is wrong
         # We need to distinguish that from lost connection
         # Don't forget zero padding
+        if not 0 <= position < len(self.cmd.POSITION_STRINGS):
+            raise PLDeviceCommandError(f"Wrong valve position {position}")
         try:
-            self.send(self.cmd.MOVE_TO_POSITION, f"{position:02d}")
+            self.send(self.cmd.MOVE_TO_POSITION, self.cmd.POSITION_STRINGS[position])
+            self._invalidate_cached(self.cmd.GET_STATUS)
         except PLConnectionTimeoutError:
             if self.is_connected:
                 raise PLDeviceCommandError(f"Wrong valve position {position}")
@@ -183,13 +211,32 @@ class IDEXMXIIValve(AbstractDistributionValve):
         """
         return self.get_status()
 
-    def sample(self, seconds: int):
+    def sample(self, seconds: int, blocking: bool = True):
         """Move valve to position 2 for `seconds`, then switch back to 1.
 
         Args:
             seconds (int): Number of seconds to stay in position 2.
+            blocking (bool): If False, return immediately and switch the valve
+                             back from a background timer.
         """
 
+        self.cancel_sample()
         self.set_valve_position(2)
-        time.sleep(seconds)
-        self.set_valve_position(1)
+        if blocking:
+            time.sleep(seconds)
+            self.set_valve_position(1)
+            return
+        self._sample_timer = threading.Timer(seconds, self.set_valve_position, args=(1,))
+        self._sample_timer.start()
+
+    def cancel_sample(self):
+        """Ends pending non-blocking sampling early, switching the valve back to 1.
+        """
+
+        timer = self._sample_timer
+        if timer is None:
+            return
+        self._sample_timer = None
+        if timer.is_alive():
+            timer.cancel()
+            self.set_valve_position(1)
@@ -1,15 +1,17 @@
 """PyLabware driver for IKA Microstar 75 overhead stirrer."""
 
 from typing import Optional, Union
+import threading
 import serial
 
 # Core imports
 from .. import parsers as parser
 from ..controllers import AbstractStirringController, in_simulation_device_returns
 from ..exceptions import PLConnectionError
-from ..models import LabDeviceCommands, ConnectionParameters
+from ..models import LabDeviceCommands, ConnectionParameters, preencode_commands
 
 
+@preencode_commands(terminator="\r\n")
 class Microstar75StirrerCommands(LabDeviceCommands):
     """Collection of command definitions for Microstar 75 overhead stirrer.
     """
@@ -86,6 +88,7 @@ class Microstar75Stirrer(AbstractStirringController):
         connection_parameters["bytesize"] = serial.SEVENBITS
         connection_parameters["parity"] = serial.PARITY_EVEN
         connection_parameters["command_delay"] = 0.3
+        connection_parameters["low_latency"] = True
 
         super().__init__(device_name, connection_mode, connection_parameters)
 
@@ -101,6 +104,18 @@ class Microstar75Stirrer(AbstractStirringController):
 
         # Running flag - this device doesn't have a status check command
         self._running = False
+        # Current rotation direction, updated on every direction change
+        self._rotation_direction = "CW"
+
+        # Speed replies younger than that (in seconds) are reused by the getters
+        self._speed_ttl = 0.5
+
+        # Coalesced speed updates - only the latest setpoint requested
+        # within that many seconds is sent to the device
+        self._speed_flush_delay = 0.05
+        self._pending_speed: Optional[int] = None
+        self._speed_flush_timer: Optional[threading.Timer] = None
+        self._speed_flush_lock = threading.Lock()
 
     def initialize_device(self):
         """Performs device initialization. Updates internal variable with the
@@ -108,6 +123,7 @@ class Microstar75Stirrer(AbstractStirringController):
         """
 
         self.get_speed_setpoint()
+        self.get_rotation_direction()
         self.logger.info("Device initialized.")
 
     def reset(self):
@@ -127,11 +143,15 @@ class Microstar75Stirrer(AbstractStirringController):
             return False
         return reply == self.cmd.DEFAULT_NAME
 
-    def is_idle(self) -> bool:
+    def is_idle(self, verify: bool = False) -> bool:
         """Checks whether device is ready.
+
+        Args:
+            verify (bool): Check that the device is still connected
+                           before relying on the internal running flag.
         """
 
-        if not self.is_connected():
+        if verify and not self.is_connected():
             return False
         return not self._running
 
@@ -152,8 +172,9 @@ class Microstar75Stirrer(AbstractStirringController):
         """
 
         self.send(self.cmd.START)
-        self.set_speed(self._speed_setpoint)
         self._running = True
+        self.set_speed(self._speed_setpoint)
+        self._invalidate_cached(self.cmd.GET_SPEED)
 
     def stop_stirring(self):
         """Stops rotation.
@@ -161,58 +182,99 @@ class Microstar75Stirrer(AbstractStirringController):
 
         self.send(self.cmd.STOP)
         self._running = False
+        self._invalidate_cached(self.cmd.GET_SPEED)
 
-    def set_speed(self, speed: int):
+    def set_speed(self, speed: int, coalesce: bool = False):
         """Sets rotation speed.
+
+        Args:
+            speed (int): Speed setpoint, RPM.
+            coalesce (bool): Defer the update slightly, so that a burst of
+                             calls results in a single command with the latest value.
         """
 
+        if coalesce:
+            # Check the value now, so that errors are raised to the caller
+            self.check_value(self.cmd.SET_SPEED, speed)
+            self._speed_setpoint = speed
+            with self._speed_flush_lock:
+                self._pending_speed = speed
+                if self._speed_flush_timer is None:
+                    self._speed_flush_timer = threading.Timer(self._speed_flush_delay, self._flush_speed)
+                    self._speed_flush_timer.daemon = True
+                    self._speed_flush_timer.start()
+            return
+        # Immediate update supersedes any pending one
+        with self._speed_flush_lock:
+            self._pending_speed = None
         self.send(self.cmd.SET_SPEED, speed)
         self._speed_setpoint = speed
+        self._invalidate_cached(self.cmd.GET_SPEED, self.cmd.GET_SPEED_SET)
+
+    def _flush_speed(self):
+        """Sends the latest coalesced speed setpoint, if any.
+        """
+
+        with self._speed_flush_lock:
+            speed = self._pending_speed
+            self._pending_speed = None
+            self._speed_flush_timer = None
+        if speed is not None:
+            self.set_speed(speed)
 
     def get_speed(self) -> int:
         """Gets actual rotation speed.
         """
 
-        return self.send(self.cmd.GET_SPEED)
+        return self._cached_send(self.cmd.GET_SPEED, self._speed_ttl)
 
     def get_speed_setpoint(self) -> int:
         """Gets desired rotation speed.
         """
 
-        self._speed_setpoint = self.send(self.cmd.GET_SPEED_SET)
+        self._speed_setpoint = self._cached_send(self.cmd.GET_SPEED_SET, self._speed_ttl)
         return self._speed_setpoint
 
+    @in_simulation_device_returns("IN_MODE_1")
     def get_rotation_direction(self) -> str:
         """Gets current rotation direction.
         """
 
         reply = self.send(self.cmd.GET_ROTATION_DIR)
-        return self.cmd.ROTATION_DIRECTIONS[reply]
+        self._rotation_direction = self.cmd.ROTATION_DIRECTIONS[reply]
+        return self._rotation_direction
 
-    def set_rotation_direction(self, direction: str = "CW"):
+    def set_rotation_direction(self, direction: str = "CW", verify: bool = False):
         """Sets desired rotation direction - CW or CCW.
+
+        Args:
+            direction (str): Rotation direction.
+            verify (bool): Read the actual speed to check that the stirrer is off,
+                           instead of relying on the internal running flag.
         """
 
         direction = direction.upper()
         if direction not in self.cmd.ROTATION_DIRECTIONS.values():
             self.logger.error("Rotation direction can be only CW or CCW")
             return
-        if self.get_speed() != 0:
+        if self._running or (verify and self.get_speed() != 0):
             self.logger.warning("Direction change is allowed only when stirrer is off.")
             return
         if direction == "CW":
             self.send(self.cmd.SET_ROTATION_DIR_CW)
         else:
             self.send(self.cmd.SET_ROTATION_DIR_CCW)
+        self._rotation_direction = direction
 
     def change_rotation_direction(self):
         """Swaps current rotation direction.
         """
 
-        direction = self.get_rotation_direction()
-        self.stop()
-        if direction == "CW":
+        self.stop_stirring()
+        if self._rotation_direction == "CW":
             self.send(self.cmd.SET_ROTATION_DIR_CCW)
+            self._rotation_direction = "CCW"
         else:
             self.send(self.cmd.SET_ROTATION_DIR_CW)
-        self.start()
+            self._rotation_direction = "CW"
+        self.start_stirring()
@@ -7,9 +7,10 @@ import serial
 from .. import parsers as parser
 from ..controllers import AbstractHotplate, in_simulation_device_returns
 from ..exceptions import PLConnectionError, PLDeviceCommandError
-from ..models import LabDeviceCommands, ConnectionParameters
+from ..models import LabDeviceCommands, ConnectionParameters, preencode_commands
 
 
+@preencode_commands(terminator=" \r \n")
 class RCTDigitalHotplateCommands(LabDeviceCommands):
     """Collection of command definitions for for IKA RCT Digital stirring hotplate.
     """
@@ -59,6 +60,9 @@ class RCTDigitalHotplateCommands(LabDeviceCommands):
     # Reset device operation mode
     RESET = {"name": "RESET"}
 
+    # Temperature readout commands, indexed by sensor number
+    TEMP_GETTERS = (GET_TEMP, GET_TEMP_EXT)
+
 
 class RCTDigitalHotplate(AbstractHotplate):
     """
@@ -81,6 +85,7 @@ class RCTDigitalHotplate(AbstractHotplate):
         connection_parameters["baudrate"] = 9600
         connection_parameters["bytesize"] = serial.SEVENBITS
         connection_parameters["parity"] = serial.PARITY_EVEN
+        connection_parameters["low_latency"] = True
 
         super().__init__(device_name, connection_mode, connection_parameters)
 
@@ -92,6 +97,8 @@ class RCTDigitalHotplate(AbstractHotplate):
         # This device has no command to check status
         self._heating = False
         self._stirring = False
+        # Name replies younger than that (in seconds) are reused by is_connected()
+        self._conn_ttl = 1.0
 
     def initialize_device(self):
         """Set default operation mode & reset.
@@ -107,17 +114,17 @@ class RCTDigitalHotplate(AbstractHotplate):
         """
 
         try:
-            reply = self.send(self.cmd.GET_NAME)
+            reply = self._cached_send(self.cmd.GET_NAME, self._conn_ttl)
         except PLConnectionError:
             return False
         return reply == self.cmd.DEFAULT_NAME
 
     def is_idle(self) -> bool:
         """Returns True if no stirring or heating is active.
+        This device has no status command, so the answer comes from the internal state
+        and connection is not checked - an active device is busy either way.
         """
 
-        if not self.is_connected():
-            return False
         return not (self._heating or self._stirring)
 
     def get_status(self):
@@ -167,12 +174,9 @@ class RCTDigitalHotplate(AbstractHotplate):
             sensor (int): Specify which temperature probe to read.
         """
 
-        if sensor == 0:
-            return self.send(self.cmd.GET_TEMP)
-        elif sensor == 1:
-            return self.send(self.cmd.GET_TEMP_EXT)
-        else:
+        if sensor not in self.cmd.TEMP_SENSORS:
             raise PLDeviceCommandError(f"Invalid sensor provided! Allowed values are: {self.cmd.TEMP_SENSORS}")
+        return self.send(self.cmd.TEMP_GETTERS[sensor])
 
     def get_temperature_setpoint(self, sensor: int = 0) -> float:
         """Reads the current temperature setpoint.
@@ -7,9 +7,10 @@ import serial
 from .. import parsers as parser
 from ..controllers import AbstractHotplate, in_simulation_device_returns
 from ..exceptions import PLConnectionError, PLDeviceCommandError
-from ..models import LabDeviceCommands, ConnectionParameters
+from ..models import LabDeviceCommands, ConnectionParameters, preencode_commands
 
 
+@preencode_commands(terminator="\r\n")
 class RETControlViscHotplateCommands(LabDeviceCommands):
     """Collection of commands for IKA RET Control Visc stirring hotplate.
     """
@@ -84,6 +85,9 @@ class RETControlViscHotplateCommands(LabDeviceCommands):
     SET_WD_MODE_1 = {"name": "OUT_SP_WD1@", "type": int, "check": {"min": 20, "max": 1500}}
     # Set timeout (seconds) and enable watchdog mode 2 (falling back to safety settings on watchdog interrupt)
     SET_WD_MODE_2 = {"name": "OUT_SP_WD2@", "type": int, "check": {"min": 20, "max": 1500}}
+    # Clear watchdog modes - zero timeout is outside the range allowed for setting them
+    CLEAR_WD_MODE_1 = {"name": "OUT_SP_WD1@ 0"}
+    CLEAR_WD_MODE_2 = {"name": "OUT_SP_WD2@ 0"}
     # Set safety sensor error timeout
     # Get sensor error timeout
     GET_SENSOR_TIMEOUT = {"name": "IN_SP_54", "reply": {"type": float, "parser": parser.slicer, "args": [-2]}}
@@ -99,6 +103,11 @@ class RETControlViscHotplateCommands(LabDeviceCommands):
     # Get intermittent mode off time, seconds
     GET_CYCLE_OFF_TIME = {"name": "IN_SP_56", "reply": {"type": float, "parser": parser.slicer, "args": [-2]}}
 
+    # Temperature commands, indexed by sensor number
+    TEMP_GETTERS = (GET_TEMP, GET_TEMP_EXT, GET_TEMP_EXT_2)
+    TEMP_SP_GETTERS = (GET_TEMP_SET, GET_TEMP_EXT_SET, GET_TEMP_EXT_2_SET)
+    TEMP_SP_SETTERS = (SET_TEMP, SET_TEMP_EXT, SET_TEMP_EXT_2)
+
 
 class RETControlViscHotplate(AbstractHotplate):
     """
@@ -121,6 +130,7 @@ class RETControlViscHotplate(AbstractHotplate):
         connection_parameters["baudrate"] = 9600
         connection_parameters["bytesize"] = serial.SEVENBITS
         connection_parameters["parity"] = serial.PARITY_EVEN
+        connection_parameters["low_latency"] = True
 
         super().__init__(device_name, connection_mode, connection_parameters)
 
@@ -132,6 +142,10 @@ class RETControlViscHotplate(AbstractHotplate):
         # This device has no command to check status
         self._heating = False
         self._stirring = False
+        # Name replies younger than that (in seconds) are reused by is_connected()
+        self._conn_ttl = 1.0
+        # Firmware version, read once the device is identified
+        self._fw_version: Optional[str] = None
 
     def initialize_device(self):
         """Resets the device.
@@ -144,30 +158,38 @@ class RETControlViscHotplate(AbstractHotplate):
         """Checks whether the device is connected.
         """
 
+        # Once identified, the device name alone confirms the connection
+        if self._fw_version is not None:
+            try:
+                return self._cached_send(self.cmd.GET_NAME, self._conn_ttl) == self.cmd.DEFAULT_NAME
+            except PLConnectionError:
+                return False
+
         try:
-            reply = self.send(self.cmd.GET_NAME)
+            reply, version = self.send_pipelined([self.cmd.GET_NAME, self.cmd.GET_VERSION])
         except PLConnectionError:
             return False
 
         if reply == self.cmd.DEFAULT_NAME:
+            self._fw_version = version
             return True
         # Check if the stirplate is likely to be an IKA RET Control Visc (based on firmware version) and rename it
-        elif self.send(self.cmd.GET_VERSION)[0:3] == "110":
+        if version is not None and version[0:3] == "110":
             self.logger.warning("is_connected()::An IKA RET hotplate with non-standard name has been detected."
                                 "Ensure that the right device is connected!"
                                 "The name will be now reset to default %s", self.cmd.DEFAULT_NAME)
             # Set name to default for easier identification
             self.send(self.cmd.SET_NAME, self.cmd.DEFAULT_NAME)
+            self._fw_version = version
             return True
-        else:
-            return False
+        return False
 
     def is_idle(self) -> bool:
         """Returns True if no stirring or heating is active.
+        This device has no status command, so the answer comes from the internal state
+        and connection is not checked - an active device is busy either way.
         """
 
-        if not self.is_connected():
-            return False
         return not (self._heating or self._stirring)
 
     def get_status(self):
@@ -217,14 +239,9 @@ class RETControlViscHotplate(AbstractHotplate):
             sensor (int): Specify which temperature probe to read.
         """
 
-        if sensor == 0:
-            return self.send(self.cmd.GET_TEMP)
-        elif sensor == 1:
-            return self.send(self.cmd.GET_TEMP_EXT)
-        elif sensor == 2:
-            return self.send(self.cmd.GET_TEMP_EXT_2)
-        else:
+        if sensor not in self.cmd.TEMP_SENSORS:
             raise PLDeviceCommandError(f"Invalid sensor provided! Allowed values are: {self.cmd.TEMP_SENSORS}")
+        return self.send(self.cmd.TEMP_GETTERS[sensor])
 
     def get_temperature_setpoint(self, sensor: int = 0) -> float:
         """Gets desired temperature setpoint.
@@ -233,14 +250,9 @@ class RETControlViscHotplate(AbstractHotplate):
             sensor (int): Specify which temperature setpoint to read.
         """
 
-        if sensor == 0:
-            return self.send(self.cmd.GET_TEMP_SET)
-        elif sensor == 1:
-            return self.send(self.cmd.GET_TEMP_EXT_SET)
-        elif sensor == 2:
-            return self.send(self.cmd.GET_TEMP_EXT_2_SET)
-        else:
+        if sensor not in self.cmd.TEMP_SENSORS:
             raise PLDeviceCommandError(f"Invalid sensor provided! Allowed values are: {self.cmd.TEMP_SENSORS}")
+        return self.send(self.cmd.TEMP_SP_GETTERS[sensor])
 
     def get_safety_temperature(self) -> float:
         """Gets safety temperature sensor reading.
@@ -261,14 +273,9 @@ class RETControlViscHotplate(AbstractHotplate):
             sensor (int): Specify which temperature probe the setpoint applies to.
         """
 
-        if sensor == 0:
-            self.send(self.cmd.SET_TEMP, temperature)
-        elif sensor == 1:
-            self.send(self.cmd.SET_TEMP_EXT, temperature)
-        elif sensor == 2:
-            self.send(self.cmd.SET_TEMP_EXT_2, temperature)
-        else:
+        if sensor not in self.cmd.TEMP_SENSORS:
             raise PLDeviceCommandError(f"Invalid sensor provided! Allowed values are: {self.cmd.TEMP_SENSORS}")
+        self.send(self.cmd.TEMP_SP_SETTERS[sensor], temperature)
 
     def get_speed(self) -> int:
         """Gets current stirring speed.
@@ -316,10 +323,9 @@ class RETControlViscHotplate(AbstractHotplate):
         """This can be cleared remotely
         """
 
-        # Set failsafe temperature
-        self.send(self.cmd.SET_WD_SAFE_TEMP, temperature)
-        # Set failsafe speed
-        self.send(self.cmd.SET_WD_SAFE_SPEED, speed)
+        # Set failsafe temperature & speed in one go
+        self.send_pipelined([(self.cmd.SET_WD_SAFE_TEMP, temperature),
+                             (self.cmd.SET_WD_SAFE_SPEED, speed)])
 
     def start_watchdog_mode2(self, timeout: int):
         """This doesn't display any error as advertised in the manual, just falls back to safety values
@@ -331,5 +337,4 @@ class RETControlViscHotplate(AbstractHotplate):
         """Clears mode2 watchdog.
         """
 
-        self.send(self.cmd.SET_WD_MODE_1, 0)
-        self.send(self.cmd.SET_WD_MODE_2, 0)
+        self.send_pipelined([self.cmd.CLEAR_WD_MODE_1, self.cmd.CLEAR_WD_MODE_2])
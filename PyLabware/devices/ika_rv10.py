@@ -6,10 +6,11 @@ import serial
 # Core imports
 from .. import parsers as parser
 from ..controllers import AbstractRotavap, in_simulation_device_returns
-from ..exceptions import PLConnectionError
-from ..models import LabDeviceCommands, ConnectionParameters
+from ..exceptions import PLConnectionError, PLDeviceCommandError
+from ..models import LabDeviceCommands, ConnectionParameters, preencode_commands
 
 
+@preencode_commands(terminator="\r\n")
 class RV10RotovapCommands(LabDeviceCommands):
     """Collection of command definitions for RV10 rotavap.
     """
@@ -23,6 +24,8 @@ class RV10RotovapCommands(LabDeviceCommands):
         "E01": "No rotation",
         "E02": "No communication with the heating bath"
     }
+    # Separate literal for remote operation status
+    STATUS_REMOTE = "1"
 
     # Heating mediums for the bath
     HEATING_MEDIUMS = {
@@ -111,6 +114,7 @@ class RV10Rotovap(AbstractRotavap):
         connection_parameters["baudrate"] = 9600
         connection_parameters["bytesize"] = serial.SEVENBITS
         connection_parameters["parity"] = serial.PARITY_EVEN
+        connection_parameters["low_latency"] = True
 
         super().__init__(device_name, connection_mode, connection_parameters)
 
@@ -125,20 +129,41 @@ class RV10Rotovap(AbstractRotavap):
         self._speed_setpoint: int = 0
         self._heating = False
         self._temperature_setpoint: float = 0
+        # Setpoint limits for checking the values while heating/rotation is off
+        self._temp_min = self.cmd.SET_TEMP["check"]["min"]
+        self._temp_max = self.cmd.SET_TEMP["check"]["max"]
+        self._speed_min = self.cmd.SET_SPEED["check"]["min"]
+        self._speed_max = self.cmd.SET_SPEED["check"]["max"]
+
+        # Name replies younger than that (in seconds) are reused by is_connected()
+        self._conn_ttl = 1.0
+
+        # Background temperature polling - doubles as a keep-alive, so it never stops completely
+        # Polling is faster while the bath is heating towards a distant setpoint
+        self._temperature_task = None
+        self._temperature_poll_interval = 10
+        self._temperature_poll_interval_fast = 2
+        # Setpoint deviation (in °C) beyond which fast polling is used
+        self._temperature_poll_band = 2
 
     def initialize_device(self):
         """Performs reset and do a custom initialization sequence.
         """
 
         self.send(self.cmd.RESET)
+        self._invalidate_cached(self.cmd.GET_NAME)
         # This is legacy initialization from PL1
         # According to Sebastian, without it RV didn't enter remote control mode
-        # TODO Check if it's actually needed
-        self.start_temperature_regulation()
-        self.stop_temperature_regulation()
-        self.start_rotation()
-        self.stop_rotation()
-        self.start_task(interval=10, method=self.get_temperature)
+        # So it is only done if the device doesn't report remote operation already
+        status = self.send(self.cmd.GET_STATUS)
+        if status is not None and status.startswith(self.cmd.STATUS_REMOTE):
+            self.logger.info("Device already in remote operation mode, skipping warm-up.")
+        else:
+            self.start_temperature_regulation()
+            self.stop_temperature_regulation()
+            self.start_rotation()
+            self.stop_rotation()
+        self._temperature_task = self.start_task(interval=self._temperature_poll_interval, method=self._poll_temperature)
 
     @in_simulation_device_returns(RV10RotovapCommands.DEFAULT_NAME)
     def is_connected(self) -> bool:
@@ -146,7 +171,7 @@ class RV10Rotovap(AbstractRotavap):
         """
 
         try:
-            reply = self.send(self.cmd.GET_NAME)
+            reply = self._cached_send(self.cmd.GET_NAME, self._conn_ttl)
         except PLConnectionError:
             return False
         return reply == self.cmd.DEFAULT_NAME
@@ -155,9 +180,10 @@ class RV10Rotovap(AbstractRotavap):
         """Checks if device is ready - no explicit method for that.
         """
 
-        if not self.is_connected():
+        # Busy device needs no probing, idle one is confirmed with a (cached) name check
+        if self._heating or self._rotating:
             return False
-        return not (self._heating or self._rotating)
+        return self.is_connected()
 
     def get_status(self):
         """Not yet implemented. #TODO
@@ -217,14 +243,18 @@ class RV10Rotovap(AbstractRotavap):
                           Thus, the sensor variable has no effect here.
         """
 
-        # If heating is not on, just update internal variable
-        if not self._heating:
-            # Check value against limits before updating
-            self.check_value(self.cmd.SET_TEMP, temperature)
-            self._temperature_setpoint = temperature
-        else:
+        temperature_type = self.cmd.SET_TEMP["type"]
+        try:
+            temperature = temperature_type(temperature)
+        except (TypeError, ValueError):
+            raise PLDeviceCommandError(f"Can't cast value <{temperature}> to type <{temperature_type}>.") from None
+        # If heating is on, update the device, otherwise just check the value & update internal variable
+        if self._heating:
             self.send(self.cmd.SET_TEMP, temperature)
-            self._temperature_setpoint = temperature
+        elif not self._temp_min <= temperature <= self._temp_max:
+            raise PLDeviceCommandError(f"Requested temperature <{temperature}> is outside the limits "
+                                       f"[{self._temp_min}, {self._temp_max}] °C!")
+        self._temperature_setpoint = temperature
 
     def get_temperature(self, sensor: int = 0) -> float:
         """Gets current bath temperature.
@@ -237,6 +267,19 @@ class RV10Rotovap(AbstractRotavap):
 
         return self.send(self.cmd.GET_TEMP)
 
+    def _poll_temperature(self) -> float:
+        """Reads the bath temperature and adjusts the polling interval of the background task.
+        """
+
+        temperature = self.get_temperature()
+        interval = self._temperature_poll_interval
+        if self._heating and temperature is not None \
+                and abs(temperature - self._temperature_setpoint) > self._temperature_poll_band:
+            interval = self._temperature_poll_interval_fast
+        if self._temperature_task is not None:
+            self._temperature_task.interval = interval
+        return temperature
+
     def get_temperature_setpoint(self, sensor: int = 0) -> float:
         """Reads the current temperature setpoint.
 
@@ -269,14 +312,18 @@ class RV10Rotovap(AbstractRotavap):
         """Sets desired rotation speed.
         """
 
-        # If rotation is not on, just update internal variable
-        if not self._rotating:
-            # Check value against limits before updating
-            self.check_value(self.cmd.SET_SPEED, speed)
-            self._speed_setpoint = speed
-        else:
+        speed_type = self.cmd.SET_SPEED["type"]
+        try:
+            speed = speed_type(speed)
+        except (TypeError, ValueError):
+            raise PLDeviceCommandError(f"Can't cast value <{speed}> to type <{speed_type}>.") from None
+        # If rotation is on, update the device, otherwise just check the value & update internal variable
+        if self._rotating:
             self.send(self.cmd.SET_SPEED, speed)
-            self._speed_setpoint = speed
+        elif not self._speed_min <= speed <= self._speed_max:
+            raise PLDeviceCommandError(f"Requested speed <{speed}> is outside the limits "
+                                       f"[{self._speed_min}, {self._speed_max}] RPM!")
+        self._speed_setpoint = speed
 
     def get_speed(self) -> int:
         """Gets actual rotation speed.
@@ -1,7 +1,8 @@
 """PyLabware driver for Julabo CF41 chiller."""
 
+import logging
 import threading
-from time import sleep
+from time import monotonic
 from typing import Optional, Union
 
 import serial
@@ -13,9 +14,10 @@ from ..exceptions import (PLConnectionError,
                           PLDeviceCommandError,
                           PLDeviceInternalError,
                           PLDeviceReplyError)
-from ..models import LabDeviceCommands, ConnectionParameters
+from ..models import LabDeviceCommands, ConnectionParameters, preencode_commands
 
 
+@preencode_commands(terminator="\r\n")
 class CF41ChillerCommands(LabDeviceCommands):
     """Collection of command definitions for CF41 chiller.
     """
@@ -41,6 +43,11 @@ class CF41ChillerCommands(LabDeviceCommands):
     # Pump speed modes
     PUMP_SPEED_MODES = [1, 2, 3, 4]
 
+    # Valid mode values for quick membership checks
+    SETPOINT_MODE_KEYS = frozenset(SETPOINT_MODES)
+    REGULATION_MODE_KEYS = frozenset(REGULATION_MODES)
+    PUMP_SPEED_MODE_KEYS = frozenset(PUMP_SPEED_MODES)
+
     STATUSES = {
         "00": "STOPPED",
         "02": "STOPPED",
@@ -77,6 +84,11 @@ class CF41ChillerCommands(LabDeviceCommands):
 
     }
 
+    # Status code -> (severity, message) for a single lookup in check_errors()
+    STATUS_TABLE = {**{code: ("ok", msg) for code, msg in STATUSES.items()},
+                    **{code: ("warning", msg) for code, msg in WARNINGS.items()},
+                    **{code: ("error", msg) for code, msg in ERRORS.items()}}
+
     # ################### Control commands ###################################
 
     # Get software version
@@ -99,6 +111,10 @@ class CF41ChillerCommands(LabDeviceCommands):
     GET_TEMP_SP3 = {"name": "IN_SP_02", "reply": {"type": float}}
     SET_TEMP_SP3 = {"name": "OUT_SP_02", "type": float, "check": {"min": -40, "max": 110}}
 
+    # Setpoint commands, indexed by active setpoint number
+    TEMP_SP_GETTERS = (GET_TEMP_SP1, GET_TEMP_SP2, GET_TEMP_SP3)
+    TEMP_SP_SETTERS = (SET_TEMP_SP1, SET_TEMP_SP2, SET_TEMP_SP3)
+
     # Get/set pump speed mode
     GET_PUMP_SPEED = {"name": "IN_SP_07", "reply": {"type": int}}
     SET_PUMP_SPEED = {"name": "OUT_SP_07", "type": int, "check": {"values": PUMP_SPEED_MODES}}
@@ -253,6 +269,7 @@ class CF41Chiller(AbstractTemperatureController):
         connection_parameters["parity"] = serial.PARITY_EVEN
         connection_parameters["rtscts"] = True
         connection_parameters["command_delay"] = 0.3
+        connection_parameters["low_latency"] = True
 
         # Protocol settings
         self.command_terminator = "\r\n"
@@ -261,6 +278,21 @@ class CF41Chiller(AbstractTemperatureController):
 
         super().__init__(device_name, connection_mode, connection_parameters)
 
+        # Maximum age of the cached active setpoint index, seconds
+        self._active_sp_ttl = 2.0
+
+        # Status polling interval for check_errors(), seconds. Doubles while
+        # the device keeps reporting the same normal status, up to the maximum.
+        self._status_interval_min = 0.3
+        self._status_interval_max = 5.0
+        self._status_interval = self._status_interval_min
+        self._last_status = None
+        self._last_status_time = 0.0
+
+        # Set to stop the temperature ramp running in the background
+        self._ramp_cancel = threading.Event()
+        self._ramp_thread = None
+
     def initialize_device(self):
         """This chiller doesn't have initialization method.
         """
@@ -272,25 +304,45 @@ class CF41Chiller(AbstractTemperatureController):
 
         return self.send(self.cmd.GET_STATUS)
 
-    def check_errors(self):
+    def check_errors(self, force: bool = False):
         """Checks device for errors.
+
+        While the device reports the same normal status, the status is re-read
+        less and less often and the last known status is reused in between.
+
+        Args:
+            force (bool): Always read the status from the device.
         """
-        status = self.get_status()
-        # All OK
-        if status in self.cmd.STATUSES:
-            self.logger.debug("get_status()::status: <%s>", self.cmd.STATUSES[status])
+
+        now = monotonic()
+        if force or self._last_status is None or now - self._last_status_time >= self._status_interval:
+            status = self.get_status()
+            if status == self._last_status and status in self.cmd.STATUSES:
+                self._status_interval = min(self._status_interval * 2, self._status_interval_max)
+            else:
+                self._status_interval = self._status_interval_min
+            self._last_status = status
+            self._last_status_time = now
+        else:
+            status = self._last_status
+        entry = self.cmd.STATUS_TABLE.get(status)
+        if entry is None:
+            errmsg = f"Unknown status {status} received from device!"
+            self.logger.error(errmsg)
+            raise PLDeviceReplyError(errmsg)
+        severity, msg = entry
+        # All OK - the most common case, exit as early as possible
+        if severity == "ok":
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug("get_status()::status: <%s>", msg)
             return
         # Warning
-        if status in self.cmd.WARNINGS:
-            self.logger.warning("Warning! %s", self.cmd.WARNINGS[status])
+        if severity == "warning":
+            self.logger.warning("Warning! %s", msg)
             return
         # Critical error
-        if status in self.cmd.ERRORS:
-            self.logger.error("Critical error: %s", self.cmd.ERRORS[status])
-            raise PLDeviceInternalError(self.cmd.ERRORS[status])
-        errmsg = f"Unknown status {status} received from device!"
-        self.logger.error(errmsg)
-        raise PLDeviceReplyError(errmsg)
+        self.logger.error("Critical error: %s", msg)
+        raise PLDeviceInternalError(msg)
 
     def clear_errors(self):
         """Not yet implemented. #TODO
@@ -314,9 +366,10 @@ class CF41Chiller(AbstractTemperatureController):
         Returns true if the chiller is off: pump and temperature control
         """
 
-        if not self.is_connected():
+        try:
+            status = self.send(self.cmd.GET_CHILLER_STATE)
+        except PLConnectionError:
             return False
-        status = self.send(self.cmd.GET_CHILLER_STATE)
         return status == 0
 
     def start_temperature_regulation(self):
@@ -324,12 +377,16 @@ class CF41Chiller(AbstractTemperatureController):
         """
 
         self.send(self.cmd.START_CHILLER)
+        # Status is about to change - make check_errors() re-read it
+        self._last_status = None
 
     def stop_temperature_regulation(self):
         """Stops the chiller
         """
 
         self.send(self.cmd.STOP_CHILLER)
+        # Status is about to change - make check_errors() re-read it
+        self._last_status = None
 
     def get_regulation_mode(self) -> int:
         """Gets current temperature regulation mdoe.
@@ -342,7 +399,7 @@ class CF41Chiller(AbstractTemperatureController):
         """
 
         # Check if we got valid mode
-        if mode not in self.cmd.REGULATION_MODES:
+        if mode not in self.cmd.REGULATION_MODE_KEYS:
             raise PLDeviceCommandError("Invalid regulation mode provided!")
         self.send(self.cmd.SET_TEMP_REG_MODE, mode)
 
@@ -360,22 +417,23 @@ class CF41Chiller(AbstractTemperatureController):
         # Check which SP is currently active
         setpoint_active = self.get_active_setpoint()
 
-        # Choose the setpoint
-        if setpoint_active == 0:
-            self.send(self.cmd.SET_TEMP_SP1, temperature)
-        elif setpoint_active == 1:
-            self.send(self.cmd.SET_TEMP_SP2, temperature)
-        elif setpoint_active == 2:
-            self.send(self.cmd.SET_TEMP_SP3, temperature)
-        else:
-            raise PLDeviceCommandError(f"Invalid active SP <{setpoint_active}> received from the device!")
+        if setpoint_active not in self.cmd.SETPOINT_MODE_KEYS:
+            raise PLDeviceReplyError(f"Invalid active SP <{setpoint_active}> received from the device!")
+        self.send(self.cmd.TEMP_SP_SETTERS[setpoint_active], temperature)
 
     @in_simulation_device_returns(0)
     def get_active_setpoint(self) -> int:
         """ Gets currently active temperature setpoint.
         """
 
-        return self.send(self.cmd.GET_TEMP_SP)
+        return self._cached_send(self.cmd.GET_TEMP_SP, self._active_sp_ttl)
+
+    def set_active_setpoint(self, setpoint: int):
+        """Selects which temperature setpoint (SP1..SP3) the chiller uses.
+        """
+
+        self.send(self.cmd.SET_TEMP_SP, setpoint)
+        self._invalidate_cached(self.cmd.GET_TEMP_SP)
 
     def get_temperature(self, sensor: int = 0) -> float:
         """Retrieves the current temperature of the chiller.
@@ -394,7 +452,7 @@ class CF41Chiller(AbstractTemperatureController):
                                      f"'{self.device_name}'. Valid modes are '0' (internal "
                                      "regulation mode) and '1' (external regulation mode).")
         # Invalid sensor requested
-        if sensor not in self.cmd.REGULATION_MODES.keys():
+        if sensor not in self.cmd.REGULATION_MODE_KEYS:
             raise PLDeviceCommandError(f"Invalid sensor number {sensor} provided!"
                                        f"Allowed values are {self.cmd.REGULATION_MODES}")
         # Check if the sensor requested matches the regulation modes (0 - internal; 1 - external)
@@ -402,8 +460,9 @@ class CF41Chiller(AbstractTemperatureController):
         # If external probe is not connected, chiller returns "---.--"
         # which would throw an exception from parse_reply() when requesting external sensor reading
         if sensor != mode:
-            self.logger.warning("Chiller currently operates in {mode} regulation mode, "
-                                "but the reading from sensor {sensor} ({self.cmd.REGULATION_MODES[sensor]}) was requested!")
+            self.logger.warning("Chiller currently operates in %s regulation mode, "
+                                "but the reading from sensor %s (%s) was requested!",
+                                mode, sensor, self.cmd.REGULATION_MODES[sensor])
         # Internal sensor temperature
         if sensor == 0:
             return self.send(self.cmd.GET_TEMP_INT)
@@ -424,13 +483,9 @@ class CF41Chiller(AbstractTemperatureController):
         # Check which SP is currently active
         setpoint_active = self.get_active_setpoint()
 
-        if setpoint_active == 0:
-            return self.send(self.cmd.GET_TEMP_SP1)
-        if setpoint_active == 1:
-            return self.send(self.cmd.GET_TEMP_SP2)
-        if setpoint_active == 2:
-            return self.send(self.cmd.GET_TEMP_SP3)
-        raise PLDeviceReplyError(f"Invalid active SP <{setpoint_active}> received from the device!")
+        if setpoint_active not in self.cmd.SETPOINT_MODE_KEYS:
+            raise PLDeviceReplyError(f"Invalid active SP <{setpoint_active}> received from the device!")
+        return self.send(self.cmd.TEMP_SP_GETTERS[setpoint_active])
 
     # FIXME this should be refactored with new background tasks functionality
     def ramp_temperature(self, end_temperature: float, time: float):
@@ -457,23 +512,46 @@ class CF41Chiller(AbstractTemperatureController):
         self.logger.debug("ramp_temperature()::calculated ramp from <%s> to <%s> over <%s> minutes; step - <%s> degrees/min",
                           start_temperature, end_temperature, time, ramp_step)
 
-        ramp_thread = threading.Thread(target=self._ramp_runner, args=(start_temperature, ramp_step, end_temperature), daemon=True)
-        ramp_thread.start()
+        # Only one ramp can drive the setpoint at a time
+        self.cancel_ramp()
+        self._ramp_cancel.clear()
+        self._ramp_thread = threading.Thread(target=self._ramp_runner, args=(start_temperature, ramp_step, end_temperature), daemon=True)
+        self._ramp_thread.start()
         return ramp_step
 
+    def cancel_ramp(self):
+        """Stops the temperature ramp running in the background, if any.
+        The current setpoint is left as is.
+        """
+
+        self._ramp_cancel.set()
+        if self._ramp_thread is not None:
+            self._ramp_thread.join()
+            self._ramp_thread = None
+
     def _ramp_runner(self, start: float, step: float, end: float):
         """Worker function that actually does the ramp.
+
+        Each setpoint is computed from the ramp start and scheduled against
+        an absolute deadline, so serial round-trips don't accumulate as drift.
         """
 
+        ramp_start = monotonic()
+        minute = 1
         current_temperature = start + step
         self.logger.info("Ramp start.")
-        while (step > 0 and current_temperature <= end) or (step < 0 and current_temperature >= end):
-            self.logger.info("Ramping from %s to %s, current step <%s>, %s minutes left",
-                             start, end, current_temperature, abs(round(end - current_temperature)))
-            self.set_temperature(current_temperature)
+        while (step > 0 and current_temperature < end) or (step < 0 and current_temperature > end):
+            setpoint = round(current_temperature, 2)
+            if self.logger.isEnabledFor(logging.INFO):
+                self.logger.info("Ramping from %s to %s, current step <%s>, %s minutes left",
+                                 start, end, setpoint, abs(round((end - current_temperature) / step)))
+            self.set_temperature(setpoint)
+            if self._ramp_cancel.wait(max(0.0, ramp_start + 60 * minute - monotonic())):
+                self.logger.info("Ramp cancelled.")
+                return
             # Calculate next value
-            current_temperature = round(current_temperature + step, 2)
-            sleep(60)
+            minute += 1
+            current_temperature = start + step * minute
         self.logger.info("Ramp end.")
         # Set temperature to final value
         self.set_temperature(end)
@@ -486,11 +564,11 @@ class CF41Chiller(AbstractTemperatureController):
         return abs(self.send(self.cmd.GET_MAX_COOL_PWR))
 
     def set_cooling_power(self, cooling_power: int):
-        """Sets the value of the chiller cooling power in %
+        """Sets the value of the chiller cooling power in %, clamped to [0-100%].
         """
 
         # According to manual, "Enter the value with a preceding negative sign!"
-        cooling_power = -abs(cooling_power)
+        cooling_power = max(-100, -abs(int(cooling_power)))
         self.send(self.cmd.SET_MAX_COOL_PWR, cooling_power)
 
     def get_heating_power(self) -> float:
@@ -506,15 +584,19 @@ class CF41Chiller(AbstractTemperatureController):
         return self.send(self.cmd.GET_MAX_HEAT_PWR)
 
     def set_heating_power(self, heating_power: int = 100):
-        """Sets the heating power of the chiller, in percent [10-100%].
+        """Sets the heating power of the chiller, in percent, clamped to [10-100%].
         """
 
-        heating_power = abs(heating_power)
+        heating_power = max(10, min(100, abs(int(heating_power))))
         self.send(self.cmd.SET_MAX_HEAT_PWR, heating_power)
 
     def set_recirculation_pump_speed(self, speed: int):
         """Sets the recirculation pump speed (4 different speeds allowed).
         """
+
+        if speed not in self.cmd.PUMP_SPEED_MODE_KEYS:
+            raise PLDeviceCommandError(f"Invalid pump speed <{speed}> provided! "
+                                       f"Allowed values are {self.cmd.PUMP_SPEED_MODES}")
         self.send(self.cmd.SET_PUMP_SPEED, speed)
 
     def get_recirculation_pump_speed(self) -> int:
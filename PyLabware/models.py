@@ -47,6 +47,26 @@ class LabDeviceCommands(ABC):
         raise NotImplementedError
 
 
+def preencode_commands(terminator: str = "\r\n", prefix: str = "", encoding: str = "ascii"):
+    """Class decorator for LabDeviceCommands containers. For every command
+    that doesn't take a parameter, stores the complete byte string to be sent
+    to the device under the "wire" key, so that it doesn't have to be
+    assembled and encoded on every send.
+
+    Args:
+        terminator: Command terminator, has to match the device driver setting.
+        prefix: Command prefix, has to match the device driver setting.
+        encoding: Encoding to use.
+    """
+
+    def decorator(cls):
+        for cmd in vars(cls).values():
+            if isinstance(cmd, dict) and "name" in cmd and cmd.get("type") is None:
+                cmd["wire"] = (prefix + cmd["name"] + terminator).encode(encoding)
+        return cls
+    return decorator
+
+
 class LabDeviceReply:
     """ This class defines the data model for a device reply for all transport types (plain text, HTTP REST, ...)
     """
@@ -1,6 +1,7 @@
 """PyLabware utility functions for reply parsing"""
 
 import re
+from typing import Optional
 
 
 def slicer(reply: str, *args) -> str:
@@ -17,18 +18,46 @@ def slicer(reply: str, *args) -> str:
     return reply[slice(*args)]
 
 
-def researcher(reply, *args):
+def researcher(reply, pattern, *args):
     """This is a wrapper function for reply parsing to provide consistent
     arguments order.
 
     Args:
         reply: Reply to parse with regular expression.
+        pattern: Regular expression string or pre-compiled pattern object.
+                 Extra arguments (flags) are only accepted with a string pattern.
 
     Returns:
         (re.Match): Regular expression match object.
     """
 
-    return re.search(*args, reply)
+    # Pre-compiled patterns skip the re module pattern cache lookup
+    if isinstance(pattern, re.Pattern):
+        # Flags are fixed at compile time and can't be applied here
+        if args:
+            raise TypeError("Extra arguments can't be used with a pre-compiled pattern!")
+        return pattern.search(reply)
+    return re.search(pattern, reply, *args)
+
+
+def partitioner(reply: str, key: str) -> Optional[str]:
+    """This is a fast parser for fixed-format 'KEY: value' replies
+    that doesn't involve regular expressions. The first occurrence of
+    the key is used, same as with re.search().
+
+    Args:
+        reply: Reply to parse.
+        key: Key preceding the value, without the colon.
+
+    Returns:
+        (str): Value following the key or None if the key wasn't found.
+    """
+
+    _, separator, value = reply.partition(key + ":")
+    if not separator:
+        return None
+    value = value.split(None, 1)
+    return value[0] if value else None
 
 
 def stripper(reply: str, prefix=None, suffix=None) -> str: